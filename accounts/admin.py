@@ -1,18 +1,29 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils.html import format_html
 from .models import User
 
 
+class UserChangeList(ChangeList):
+    """
+    Changelist that skips profile columns not shown in list_display.
+    """
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).defer('bio', 'profile_picture')
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     """
     Custom admin interface for the User model.
     """
-    list_display = ['username', 'email', 'get_full_name', 'role', 'is_staff', 'is_active', 'created_at']
+    list_display = ['username', 'email', 'full_name', 'role', 'is_staff', 'is_active', 'created_at']
     list_filter = ['role', 'is_staff', 'is_active', 'created_at']
-    search_fields = ['username', 'email', 'first_name', 'last_name', 'github_username']
+    search_fields = ['username', 'email', 'full_name', 'github_username']
     ordering = ['-created_at']
+    sortable_by = ['username', 'email', 'full_name', 'role', 'created_at']
+    filter_horizontal = ['user_permissions']
+    autocomplete_fields = ['groups']
     
     fieldsets = list(BaseUserAdmin.fieldsets) + [
         ('Profile Information', {
@@ -24,7 +35,7 @@ class UserAdmin(BaseUserAdmin):
         }),
     ]
     
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['full_name', 'created_at', 'updated_at']
     
     add_fieldsets = list(BaseUserAdmin.add_fieldsets) + [
         ('Profile Information', {
@@ -32,7 +43,5 @@ class UserAdmin(BaseUserAdmin):
         }),
     ]
 
-    def get_full_name(self, obj):
-        """Display full name in list view."""
-        return obj.get_full_name()
-    get_full_name.short_description = 'Full Name'
+    def get_changelist(self, request, **kwargs):
+        return UserChangeList
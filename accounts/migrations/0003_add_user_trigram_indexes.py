@@ -0,0 +1,44 @@
+# Trigram GIN indexes backing the UserAdmin search_fields icontains lookups.
+# PostgreSQL only: the operations are skipped on other database backends.
+# Django renders icontains as UPPER(col::text) LIKE UPPER(...), so the index
+# is built on that expression.
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ('accounts_user_username_trgm', 'username'),
+    ('accounts_user_email_trgm', 'email'),
+    ('accounts_user_first_name_trgm', 'first_name'),
+    ('accounts_user_last_name_trgm', 'last_name'),
+    ('accounts_user_github_username_trgm', 'github_username'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('accounts', 'User')._meta.db_table)
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} '
+            f'ON {table} USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_add_user_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
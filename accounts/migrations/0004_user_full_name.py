@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:04
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_add_user_trigram_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=301)),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['full_name'], name='accounts_us_full_na_88336b_idx'),
+        ),
+    ]
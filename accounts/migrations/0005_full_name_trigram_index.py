@@ -0,0 +1,53 @@
+# UserAdmin now searches full_name instead of first_name and last_name, so the
+# trigram index moves to full_name and the per-column ones are dropped.
+# PostgreSQL only: the operations are skipped on other database backends.
+
+from django.db import migrations
+
+FULL_NAME_INDEX = ('accounts_user_full_name_trgm', 'full_name')
+
+NAME_PART_INDEXES = [
+    ('accounts_user_first_name_trgm', 'first_name'),
+    ('accounts_user_last_name_trgm', 'last_name'),
+]
+
+
+def create_index(schema_editor, table, name, column):
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} '
+        f'ON {table} USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)'
+    )
+
+
+def drop_index(schema_editor, name):
+    schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+def index_full_name(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('accounts', 'User')._meta.db_table)
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    create_index(schema_editor, table, *FULL_NAME_INDEX)
+    for name, column in NAME_PART_INDEXES:
+        drop_index(schema_editor, name)
+
+
+def index_name_parts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('accounts', 'User')._meta.db_table)
+    for name, column in NAME_PART_INDEXES:
+        create_index(schema_editor, table, name, column)
+    drop_index(schema_editor, FULL_NAME_INDEX[0])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_full_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(index_full_name, index_name_parts),
+    ]
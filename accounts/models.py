@@ -1,11 +1,21 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat
 
 
 class User(AbstractUser):
     """
     Custom User model extending Django's AbstractUser.
     """
+    ROLE_CHOICES = [
+        ('developer', 'Developer'),
+        ('manager', 'Project Manager'),
+        ('tester', 'Tester'),
+        ('designer', 'Designer'),
+        ('analyst', 'Business Analyst'),
+    ]
+
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=150, blank=False)
     last_name = models.CharField(max_length=150, blank=False)
@@ -27,16 +37,15 @@ class User(AbstractUser):
     )
     role = models.CharField(
         max_length=50,
-        choices=[
-            ('developer', 'Developer'),
-            ('manager', 'Project Manager'),
-            ('tester', 'Tester'),
-            ('designer', 'Designer'),
-            ('analyst', 'Business Analyst'),
-        ],
+        choices=ROLE_CHOICES,
         default='developer',
         help_text="Your primary role in development projects"
     )
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=301),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -44,6 +53,12 @@ class User(AbstractUser):
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ['first_name', 'last_name']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['role']),
+            models.Index(fields=['first_name', 'last_name']),
+            models.Index(fields=['full_name']),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.username})"
@@ -1,3 +1,51 @@
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .models import User
+
+
+class UserAdminTests(TestCase):
+    """UserAdmin changelist reads the database-generated full name."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='password',
+            first_name='Ada',
+            last_name='Lovelace',
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_full_name_is_generated(self):
+        self.assertEqual(User.objects.get(pk=self.user.pk).full_name, 'Ada Lovelace')
+
+    def test_changelist_search_by_full_name(self):
+        response = self.client.get(reverse('admin:accounts_user_changelist'), {'q': 'Ada Love'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['cl'].result_list), [self.user])
+
+    def test_change_form_renders(self):
+        response = self.client.get(reverse('admin:accounts_user_change', args=[self.user.pk]))
+        self.assertEqual(response.status_code, 200)
+
+
+class RegisterViewTests(TestCase):
+    """Registration creates the user once and logs them in."""
+
+    def test_register_logs_in_new_user(self):
+        response = self.client.post(reverse('accounts:register'), {
+            'username': 'grace',
+            'email': 'grace@example.com',
+            'first_name': 'Grace',
+            'last_name': 'Hopper',
+            'role': 'developer',
+            'password1': 'c0mpiler-Pioneer',
+            'password2': 'c0mpiler-Pioneer',
+        })
+        self.assertRedirects(response, reverse('tracker:dashboard'), fetch_redirect_response=False)
+        user = User.objects.get(username='grace')
+        self.assertEqual(int(self.client.session['_auth_user_id']), user.pk)
@@ -1,4 +1,4 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import redirect
 from django.contrib.auth import login
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import CreateView, DetailView, UpdateView
@@ -20,9 +20,8 @@ class RegisterView(CreateView):
     def form_valid(self, form):
         """Log in the user after successful registration."""
         response = super().form_valid(form)
-        user = form.save()
-        login(self.request, user)
-        messages.success(self.request, f'Welcome {user.get_short_name()}! Your account has been created successfully.')
+        login(self.request, self.object)
+        messages.success(self.request, f'Welcome {self.object.get_short_name()}! Your account has been created successfully.')
         return response
 
     def dispatch(self, request, *args, **kwargs):
@@ -32,7 +31,21 @@ class RegisterView(CreateView):
         return super().dispatch(request, *args, **kwargs)
 
 
-class ProfileView(LoginRequiredMixin, DetailView):
+class CurrentUserMixin:
+    """
+    Operate on the logged-in user that the auth middleware already loaded.
+    """
+
+    def get_queryset(self):
+        """Restrict any queryset lookups to the current user's row."""
+        return User.objects.filter(pk=self.request.user.pk)
+
+    def get_object(self, queryset=None):
+        """Return the current user's profile without another query."""
+        return self.request.user
+
+
+class ProfileView(LoginRequiredMixin, CurrentUserMixin, DetailView):
     """
     User profile view.
     """
@@ -40,12 +53,8 @@ class ProfileView(LoginRequiredMixin, DetailView):
     template_name = 'accounts/profile.html'
     context_object_name = 'profile_user'
 
-    def get_object(self):
-        """Return the current user's profile."""
-        return self.request.user
-
 
-class ProfileEditView(LoginRequiredMixin, UpdateView):
+class ProfileEditView(LoginRequiredMixin, CurrentUserMixin, UpdateView):
     """
     User profile edit view.
     """
@@ -54,10 +63,6 @@ class ProfileEditView(LoginRequiredMixin, UpdateView):
     template_name = 'accounts/profile_edit.html'
     success_url = reverse_lazy('accounts:profile')
 
-    def get_object(self):
-        """Return the current user's profile."""
-        return self.request.user
-
     def form_valid(self, form):
         """Show success message after profile update."""
         messages.success(self.request, 'Your profile has been updated successfully.')
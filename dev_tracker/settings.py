@@ -130,7 +130,8 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
-STATIC_URL = '/static/'
+# Point STATIC_URL at a CDN in production; the web server serves STATIC_ROOT
+STATIC_URL = config('STATIC_URL', default='/static/')
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 STATICFILES_DIRS = [
@@ -250,6 +251,10 @@ CACHES = {
     }
 }
 
+# Number of export_project_data runs allowed at once; further runs fail, or
+# queue when started with --wait
+EXPORT_MAX_CONCURRENT = config('EXPORT_MAX_CONCURRENT', default=1, cast=int)
+
 # Development Toolbar (if installed)
 if DEBUG:
     try:
@@ -260,6 +265,24 @@ if DEBUG:
     except ImportError:
         pass
 
+# Request profiling with django-silk (if installed). On by default in DEBUG;
+# set ENABLE_SILK=True to profile a staging deployment, ideally together with
+# SILKY_INTERCEPT_PERCENT so only a sample of requests is recorded.
+if config('ENABLE_SILK', default=DEBUG, cast=bool):
+    try:
+        import silk
+        INSTALLED_APPS += ['silk']
+        MIDDLEWARE += ['silk.middleware.SilkyMiddleware']
+        SILKY_AUTHENTICATION = True
+        SILKY_AUTHORISATION = True
+        SILKY_PERMISSIONS = lambda user: user.is_superuser
+        SILKY_META = True
+        SILKY_INTERCEPT_PERCENT = config('SILKY_INTERCEPT_PERCENT', default=100, cast=int)
+        SILKY_MAX_RECORDED_REQUESTS = 10000
+        SILKY_MAX_RECORDED_REQUESTS_CHECK_PERCENT = 10
+    except ImportError:
+        pass
+
 # Environment-specific settings
 if not DEBUG:
     # Production security settings
@@ -270,6 +293,16 @@ if not DEBUG:
     SESSION_COOKIE_SECURE = True
     CSRF_COOKIE_SECURE = True
     
+    # Hashed filenames so collected static files can be cached far-future
+    STORAGES = {
+        'default': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        },
+        'staticfiles': {
+            'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage',
+        },
+    }
+    
     # Use database cache for production
     CACHES['default']['BACKEND'] = 'django.core.cache.backends.db.DatabaseCache'
     CACHES['default']['LOCATION'] = 'cache_table'
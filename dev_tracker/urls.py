@@ -10,9 +10,11 @@ Main URL Structure:
 - /accounts/ - User authentication (login/logout)
 - /tracker/ - Main application (dashboard, projects, apps, tasks)
 - /api/ - RESTful API endpoints for AJAX functionality
+- /silk/ - Request profiling (superusers only, when django-silk is enabled)
 
-Static and media files are served during development.
-For production deployment, configure web server to serve static files.
+Media files are served during development; runserver's staticfiles app
+serves static files. In production the web server (or CDN) serves
+STATIC_ROOT, populated by collectstatic with hashed filenames.
 """
 from django.contrib import admin
 from django.urls import path, include
@@ -43,7 +45,10 @@ urlpatterns = [
     path('', RedirectView.as_view(url='/tracker/', permanent=False)),
 ]
 
-# Serve static and media files during development
+# Serve uploaded media files during development
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+
+# Profiling UI, only when django-silk is enabled in settings
+if 'silk' in settings.INSTALLED_APPS:
+    urlpatterns += [path('silk/', include('silk.urls', namespace='silk'))]
@@ -13,6 +13,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dev_tracker.settings')
 django.setup()
 
+from django.db.models import Count, Q
+from django.db.models.functions import Substr
+
 from tracker.models import Artifact
 
 def test_artifact_creation():
@@ -59,10 +62,13 @@ def test_artifact_creation():
     # Test 3: Verify model properties work
     print("\n📝 Test 3: Testing model properties and methods")
     
-    artifacts = Artifact.objects.all()
-    for artifact in artifacts[:3]:  # Test first 3 artifacts
+    artifacts = Artifact.objects.select_related('application').only(
+        'name', 'version', 'file_size_bytes', 'application', 'application__name'
+    ).annotate(preview=Substr('content', 1, 50))[:3]  # Test first 3 artifacts
+    for artifact in artifacts.iterator(chunk_size=200):
         try:
             print(f"📄 Artifact: {artifact}")
+            print(f"   Content preview: {artifact.preview}...")
             print(f"   Has application: {artifact.application is not None}")
             print(f"   File size: {artifact.file_size_mb} MB")
             print(f"   Absolute URL: {artifact.get_absolute_url()}")
@@ -71,10 +77,15 @@ def test_artifact_creation():
     
     print("\n" + "=" * 50)
     print("🎉 Artifact functionality test completed!")
+    counts = Artifact.objects.aggregate(
+        total=Count('pk'),
+        standalone=Count('pk', filter=Q(application__isnull=True)),
+        linked=Count('pk', filter=Q(application__isnull=False)),
+    )
     print(f"\nSummary:")
-    print(f"- Total artifacts: {Artifact.objects.count()}")
-    print(f"- Standalone artifacts: {Artifact.objects.filter(application__isnull=True).count()}")
-    print(f"- Application-linked artifacts: {Artifact.objects.filter(application__isnull=False).count()}")
+    print(f"- Total artifacts: {counts['total']}")
+    print(f"- Standalone artifacts: {counts['standalone']}")
+    print(f"- Application-linked artifacts: {counts['linked']}")
     
     print(f"\n✅ Key Updates Implemented:")
     print(f"• Application field is now optional (null=True, blank=True)")
@@ -43,11 +43,9 @@ def test_critical_functionality():
     
     # Test 3: Check model properties work
     print("\n🔧 Testing Model Properties...")
-    projects = Project.objects.all()
+    project = Project.objects.only('id', 'target_date').first()
     
-    if projects.exists():
-        project = projects.first()
-        
+    if project:
         # Test new properties
         try:
             days_remaining = project.days_remaining
@@ -66,11 +64,11 @@ def test_critical_functionality():
     
     # Test 4: Check Integration functionality
     print("\n🔗 Testing Integration Functionality...")
-    integrations = Integration.objects.all()
+    integration = Integration.objects.select_related('from_app__project').only(
+        'id', 'from_app', 'from_app__project', 'from_app__project__name'
+    ).first()
     
-    if integrations.exists():
-        integration = integrations.first()
-        
+    if integration:
         # Test integration project property
         try:
             project_name = integration.project.name
@@ -87,11 +85,9 @@ def test_critical_functionality():
     
     # Test 5: Check Application properties
     print("\n📱 Testing Application Properties...")
-    applications = Application.objects.all()
+    app = Application.objects.only('id', 'estimated_weeks', 'created_at').first()
     
-    if applications.exists():
-        app = applications.first()
-        
+    if app:
         try:
             days_to_target = app.days_to_target
             print(f"✅ Application days_to_target property works: {days_to_target}")
@@ -100,11 +96,9 @@ def test_critical_functionality():
     
     # Test 6: Check Task properties
     print("\n📋 Testing Task Properties...")
-    tasks = Task.objects.all()
+    task = Task.objects.only('id', 'due_date').first()
     
-    if tasks.exists():
-        task = tasks.first()
-        
+    if task:
         try:
             days_until_due = task.days_until_due
             print(f"✅ Task days_until_due property works: {days_until_due}")
@@ -0,0 +1,30 @@
+"""
+Tracker admin, one module per ModelAdmin.
+
+Shared pieces live alongside them: ``badges`` (prebuilt changelist HTML),
+``changelist`` (ChangeList, paginator and filter base classes), ``filters``
+and ``inlines``. Importing the model modules registers them with the site.
+"""
+from django.contrib import admin
+
+from .application import ApplicationAdmin
+from .artifact import ArtifactAdmin
+from .decision import DecisionAdmin
+from .integration import IntegrationAdmin
+from .project import ProjectAdmin
+from .task import TaskAdmin
+
+__all__ = [
+    'ApplicationAdmin',
+    'ArtifactAdmin',
+    'DecisionAdmin',
+    'IntegrationAdmin',
+    'ProjectAdmin',
+    'TaskAdmin',
+]
+
+
+# Custom admin site configuration
+admin.site.site_header = "FamilyHub Development Tracker Admin"
+admin.site.site_title = "Dev Tracker Admin"
+admin.site.index_title = "Welcome to FamilyHub Development Tracker Administration"
@@ -0,0 +1,88 @@
+from django.contrib import admin
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ..models import Application
+from .badges import (
+    APPLICATION_COMPLEXITY_BADGES,
+    APPLICATION_PROGRESS_TEMPLATE,
+    APPLICATION_STATUS_BADGES,
+    NO_TASKS_LABEL,
+    progress_bar,
+    render_badge,
+)
+from .changelist import TrackerChangeListMixin
+from .filters import ProjectListFilter
+from .inlines import ArtifactInline, TaskInline
+
+
+@admin.register(Application)
+class ApplicationAdmin(TrackerChangeListMixin, admin.ModelAdmin):
+    list_display = ['name', 'project', 'status_badge', 'complexity_badge', 'estimated_weeks', 'task_completion_display']
+    list_filter = [('project', ProjectListFilter), 'status', 'complexity', 'created_at']
+    search_fields = ['name', 'description', 'project__name']
+    list_select_related = ['project']
+    autocomplete_fields = ['project']
+    list_defer = ['description', 'features', 'project__description']
+    # Aggregate annotations drop Meta.ordering, so restate it here.
+    ordering = ['project', 'name']
+    readonly_fields = ['created_at', 'updated_at']
+    inlines = [ArtifactInline, TaskInline]
+    
+    fieldsets = [
+        ('Basic Information', {
+            'fields': ('project', 'name', 'description')
+        }),
+        ('Development Details', {
+            'fields': ('status', 'complexity', 'estimated_weeks')
+        }),
+        ('Features', {
+            'fields': ('features',),
+            'description': 'JSON field for storing feature list'
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    ]
+
+    actions = ['mark_as_ready', 'mark_as_development', 'mark_as_production']
+
+    def get_queryset(self, request):
+        # __str__ renders the project name, which the autocomplete widgets
+        # used by the artifact, task and integration admins rely on.
+        return super().get_queryset(request).select_related('project').annotate(
+            _total_tasks=Count('tasks'),
+            _completed_tasks=Count('tasks', filter=Q(tasks__status='completed')),
+        )
+
+    def status_badge(self, obj):
+        return render_badge(APPLICATION_STATUS_BADGES, obj.status)
+    status_badge.short_description = 'Status'
+
+    def complexity_badge(self, obj):
+        return render_badge(APPLICATION_COMPLEXITY_BADGES, obj.complexity)
+    complexity_badge.short_description = 'Complexity'
+
+    def task_completion_display(self, obj):
+        total_tasks = obj._total_tasks
+        if total_tasks == 0:
+            return NO_TASKS_LABEL
+        percentage = (obj._completed_tasks / total_tasks) * 100
+        return progress_bar(round(percentage), APPLICATION_PROGRESS_TEMPLATE)
+    task_completion_display.short_description = 'Tasks'
+
+    def mark_as_ready(self, request, queryset):
+        updated = queryset.update(status='ready', updated_at=timezone.now())
+        self.message_user(request, f'{updated} applications marked as ready.')
+    mark_as_ready.short_description = "Mark selected applications as ready"
+
+    def mark_as_development(self, request, queryset):
+        updated = queryset.update(status='development', updated_at=timezone.now())
+        self.message_user(request, f'{updated} applications marked as in development.')
+    mark_as_development.short_description = "Mark selected applications as in development"
+
+    def mark_as_production(self, request, queryset):
+        updated = queryset.update(status='production', updated_at=timezone.now())
+        self.message_user(request, f'{updated} applications marked as production.')
+    mark_as_production.short_description = "Mark selected applications as production"
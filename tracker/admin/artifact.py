@@ -0,0 +1,98 @@
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.html import format_html
+
+from ..models import Artifact, record_activity
+from .badges import (
+    ARTIFACT_STATUS_BADGES,
+    ARTIFACT_TYPE_BADGES,
+    NO_FILE_LABEL,
+    render_badge,
+)
+from .changelist import EstimatedCountPaginator, TrackerChangeListMixin
+from .filters import ApplicationListFilter
+
+
+@admin.register(Artifact)
+class ArtifactAdmin(TrackerChangeListMixin, admin.ModelAdmin):
+    list_display = ['name', 'application', 'type_badge', 'status_badge', 'version', 'file_size_display', 'created_at']
+    list_filter = [('application', ApplicationListFilter), 'type', 'status', 'created_at']
+    search_fields = ['name', 'description', 'application__name']
+    list_select_related = ['application', 'application__project']
+    autocomplete_fields = ['application', 'created_by']
+    list_defer = [
+        'description', 'content',
+        'application__description', 'application__features', 'application__project__description',
+    ]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 200
+    keyset_field = 'updated_at'
+    readonly_fields = ['created_at', 'updated_at', 'file_size_mb']
+    
+    fieldsets = [
+        ('Basic Information', {
+            'fields': ('application', 'name', 'description', 'created_by')
+        }),
+        ('Artifact Details', {
+            'fields': ('type', 'status', 'version')
+        }),
+        ('Content', {
+            'fields': ('file_upload', 'content'),
+            'description': 'Upload a file or add text content'
+        }),
+        ('File Information', {
+            'fields': ('file_size_mb',),
+            'classes': ('collapse',)
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    ]
+
+    actions = ['mark_as_review', 'mark_as_complete']
+
+    def type_badge(self, obj):
+        return render_badge(ARTIFACT_TYPE_BADGES, obj.type)
+    type_badge.short_description = 'Type'
+
+    def status_badge(self, obj):
+        return render_badge(ARTIFACT_STATUS_BADGES, obj.status)
+    status_badge.short_description = 'Status'
+
+    def file_size_display(self, obj):
+        if not obj.file_size_bytes:
+            return NO_FILE_LABEL
+        size = obj.file_size_bytes / (1024 * 1024)
+        if size > 5:
+            color = '#dc3545'  # red for large files
+        elif size > 1:
+            color = '#ffc107'  # yellow for medium files
+        else:
+            color = '#28a745'  # green for small files
+        return format_html(
+            '<span style="color: {}; font-weight: bold;">{} MB</span>',
+            color, f'{size:.1f}'
+        )
+    file_size_display.short_description = 'File Size'
+    file_size_display.admin_order_field = 'file_size_bytes'
+
+    def _update_status(self, queryset, status):
+        # Collect the ids first: the changelist filters may no longer match
+        # the rows once their status changes
+        pks = list(queryset.values_list('pk', flat=True))
+        updated = queryset.update(status=status, updated_at=timezone.now())
+        record_activity(Artifact.objects.filter(pk__in=pks).select_related('application'))
+        return updated
+
+    def mark_as_review(self, request, queryset):
+        updated = self._update_status(queryset, 'review')
+        self.message_user(request, f'{updated} artifacts marked for review.')
+    mark_as_review.short_description = "Mark selected artifacts for review"
+
+    def mark_as_complete(self, request, queryset):
+        updated = self._update_status(queryset, 'complete')
+        self.message_user(request, f'{updated} artifacts marked as complete.')
+    mark_as_complete.short_description = "Mark selected artifacts as complete"
@@ -0,0 +1,175 @@
+"""Prebuilt badge, indicator and progress-bar HTML for the tracker changelists.
+
+Everything that depends only on a choice value is rendered once at import
+time; the display callables on the ModelAdmins are dictionary lookups.
+"""
+
+from functools import cache
+
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from ..models import Project, Application, Artifact, Task, Decision, Integration
+
+
+# Badge styling shared by the changelist columns
+DEFAULT_BADGE_COLOR = '#6c757d'
+BADGE_TEMPLATE = (
+    '<span style="background-color: {}; color: white; padding: 3px 8px; '
+    'border-radius: 3px; font-size: 11px;">{}</span>'
+)
+BOLD_BADGE_TEMPLATE = (
+    '<span style="background-color: {}; color: white; padding: 3px 8px; '
+    'border-radius: 3px; font-size: 11px; font-weight: bold;">{}</span>'
+)
+
+PROJECT_STATUS_COLORS = {
+    'planning': '#17a2b8',     # info blue
+    'development': '#28a745',  # success green
+    'testing': '#fd7e14',      # orange
+    'on-hold': '#ffc107',      # warning yellow
+    'completed': '#6c757d',    # secondary gray
+}
+APPLICATION_STATUS_COLORS = {
+    'planning': '#6c757d',     # gray
+    'ready': '#17a2b8',        # info blue
+    'development': '#ffc107',  # warning yellow
+    'testing': '#fd7e14',      # orange
+    'production': '#28a745',   # success green
+}
+APPLICATION_COMPLEXITY_COLORS = {
+    'simple': '#28a745',  # green
+    'medium': '#ffc107',  # yellow
+    'high': '#dc3545',    # red
+}
+ARTIFACT_TYPE_COLORS = {
+    'requirements': '#17a2b8',   # info blue
+    'code': '#28a745',           # success green
+    'documentation': '#6f42c1',  # purple
+    'architecture': '#fd7e14',   # orange
+    'design': '#e83e8c',         # pink
+}
+ARTIFACT_STATUS_COLORS = {
+    'draft': '#6c757d',        # gray
+    'in-progress': '#ffc107',  # yellow
+    'review': '#fd7e14',       # orange
+    'complete': '#28a745',     # green
+}
+TASK_PRIORITY_COLORS = {
+    'low': '#28a745',       # green
+    'medium': '#ffc107',    # yellow
+    'high': '#fd7e14',      # orange
+    'critical': '#dc3545',  # red
+}
+TASK_STATUS_COLORS = {
+    'pending': '#6c757d',      # gray
+    'in-progress': '#17a2b8',  # info blue
+    'completed': '#28a745',    # green
+    'blocked': '#dc3545',      # red
+}
+TASK_ASSIGNEE_COLORS = {
+    'claude': '#6f42c1',          # purple
+    'github-copilot': '#0366d6',  # github blue
+    'human': '#28a745',           # green
+    'team': '#fd7e14',            # orange
+}
+TASK_ASSIGNEE_ICONS = {
+    'claude': '🤖',
+    'github-copilot': '🧑‍💻',
+    'human': '👤',
+    'team': '👥',
+}
+DECISION_STATUS_COLORS = {
+    'pending': '#ffc107',      # yellow
+    'decided': '#17a2b8',      # info blue
+    'implemented': '#28a745',  # green
+    'changed': '#6c757d',      # gray
+}
+DECISION_IMPACT_COLORS = TASK_PRIORITY_COLORS
+INTEGRATION_TYPE_COLORS = {
+    'data-sharing': '#28a745',     # green
+    'ui-integration': '#6f42c1',   # purple
+    'api-integration': '#17a2b8',  # info blue
+    'full-merge': '#fd7e14',       # orange
+}
+INTEGRATION_COMPLEXITY_COLORS = {
+    'simple': '#28a745',   # green
+    'medium': '#ffc107',   # yellow
+    'complex': '#dc3545',  # red
+}
+
+# Choice labels looked up directly instead of through get_FOO_display()
+PROJECT_STATUS_LABELS = dict(Project.STATUS_CHOICES)
+APPLICATION_STATUS_LABELS = dict(Application.STATUS_CHOICES)
+APPLICATION_COMPLEXITY_LABELS = dict(Application.COMPLEXITY_CHOICES)
+ARTIFACT_TYPE_LABELS = dict(Artifact.TYPE_CHOICES)
+ARTIFACT_STATUS_LABELS = dict(Artifact.STATUS_CHOICES)
+TASK_PRIORITY_LABELS = {value: label.upper() for value, label in Task.PRIORITY_CHOICES}
+TASK_STATUS_LABELS = dict(Task.STATUS_CHOICES)
+TASK_ASSIGNEE_LABELS = {
+    value: f'{TASK_ASSIGNEE_ICONS[value]} {label}' for value, label in Task.ASSIGNEE_CHOICES
+}
+DECISION_STATUS_LABELS = dict(Decision.STATUS_CHOICES)
+DECISION_IMPACT_LABELS = {value: label.upper() for value, label in Decision.IMPACT_CHOICES}
+INTEGRATION_TYPE_LABELS = dict(Integration.INTEGRATION_TYPE_CHOICES)
+INTEGRATION_COMPLEXITY_LABELS = {value: label.upper() for value, label in Integration.COMPLEXITY_CHOICES}
+
+
+def build_badges(colors, labels, template=BADGE_TEMPLATE):
+    """Render the badge HTML for every choice once, at import time."""
+    return {
+        value: format_html(template, colors.get(value, DEFAULT_BADGE_COLOR), label)
+        for value, label in labels.items()
+    }
+
+
+def render_badge(badges, value, template=BADGE_TEMPLATE):
+    """Return the prebuilt badge for ``value``, or a grey badge for unknown values."""
+    try:
+        return badges[value]
+    except KeyError:
+        return format_html(template, DEFAULT_BADGE_COLOR, value)
+
+
+PROJECT_STATUS_BADGES = build_badges(PROJECT_STATUS_COLORS, PROJECT_STATUS_LABELS)
+APPLICATION_STATUS_BADGES = build_badges(APPLICATION_STATUS_COLORS, APPLICATION_STATUS_LABELS)
+APPLICATION_COMPLEXITY_BADGES = build_badges(APPLICATION_COMPLEXITY_COLORS, APPLICATION_COMPLEXITY_LABELS)
+ARTIFACT_TYPE_BADGES = build_badges(ARTIFACT_TYPE_COLORS, ARTIFACT_TYPE_LABELS)
+ARTIFACT_STATUS_BADGES = build_badges(ARTIFACT_STATUS_COLORS, ARTIFACT_STATUS_LABELS)
+TASK_PRIORITY_BADGES = build_badges(TASK_PRIORITY_COLORS, TASK_PRIORITY_LABELS, BOLD_BADGE_TEMPLATE)
+TASK_STATUS_BADGES = build_badges(TASK_STATUS_COLORS, TASK_STATUS_LABELS)
+TASK_ASSIGNEE_BADGES = build_badges(TASK_ASSIGNEE_COLORS, TASK_ASSIGNEE_LABELS)
+DECISION_STATUS_BADGES = build_badges(DECISION_STATUS_COLORS, DECISION_STATUS_LABELS)
+DECISION_IMPACT_BADGES = build_badges(DECISION_IMPACT_COLORS, DECISION_IMPACT_LABELS, BOLD_BADGE_TEMPLATE)
+INTEGRATION_TYPE_BADGES = build_badges(INTEGRATION_TYPE_COLORS, INTEGRATION_TYPE_LABELS)
+INTEGRATION_COMPLEXITY_BADGES = build_badges(INTEGRATION_COMPLEXITY_COLORS, INTEGRATION_COMPLEXITY_LABELS, BOLD_BADGE_TEMPLATE)
+
+OVERDUE_INDICATOR = mark_safe('<span style="color: #dc3545; font-size: 16px;" title="Task is overdue">⚠️</span>')
+DUE_SOON_INDICATOR = mark_safe('<span style="color: #ffc107; font-size: 16px;" title="Due soon">⏰</span>')
+ON_TRACK_INDICATOR = mark_safe('<span style="color: #28a745; font-size: 16px;" title="On track">✅</span>')
+NO_DUE_DATE_INDICATOR = mark_safe('<span style="color: #6c757d;" title="No due date">➖</span>')
+NO_FILE_LABEL = mark_safe('<span style="color: #6c757d;">No file</span>')
+NO_TASKS_LABEL = mark_safe('<span style="color: #6c757d;">No tasks</span>')
+
+PROJECT_PROGRESS_TEMPLATE = (
+    '<div style="width: 100px; background-color: #e9ecef; border-radius: 3px; overflow: hidden;">'
+    '<div style="width: {}%; background-color: {}; height: 20px; text-align: center; color: white; font-size: 11px; line-height: 20px;">'
+    '{}%</div></div>'
+)
+APPLICATION_PROGRESS_TEMPLATE = (
+    '<div style="width: 80px; background-color: #e9ecef; border-radius: 3px; overflow: hidden;">'
+    '<div style="width: {}%; background-color: {}; height: 18px; text-align: center; color: white; font-size: 10px; line-height: 18px;">'
+    '{}%</div></div>'
+)
+
+
+@cache
+def progress_bar(percentage, template):
+    """Render a completion bar; keyed on whole percentages, so at most 101 entries per template."""
+    if percentage >= 90:
+        color = '#28a745'  # green
+    elif percentage >= 50:
+        color = '#ffc107'  # yellow
+    else:
+        color = '#dc3545'  # red
+    return format_html(template, percentage, color, percentage)
@@ -0,0 +1,59 @@
+from django.contrib import admin
+from django.utils.html import format_html
+
+from ..models import Decision
+from .badges import (
+    BOLD_BADGE_TEMPLATE,
+    DECISION_IMPACT_BADGES,
+    DECISION_STATUS_BADGES,
+    render_badge,
+)
+from .changelist import TrackerChangeListMixin
+from .filters import ProjectListFilter
+
+
+@admin.register(Decision)
+class DecisionAdmin(TrackerChangeListMixin, admin.ModelAdmin):
+    list_display = ['title', 'project', 'status_badge', 'impact_badge', 'age_display', 'created_at']
+    list_filter = [('project', ProjectListFilter), 'status', 'impact', 'created_at']
+    search_fields = ['title', 'description', 'decision_maker']
+    list_select_related = ['project']
+    autocomplete_fields = ['project']
+    list_defer = ['description', 'project__description']
+    keyset_field = 'created_at'
+    readonly_fields = ['created_at', 'updated_at']
+    
+    fieldsets = [
+        ('Basic Information', {
+            'fields': ('project', 'title', 'description')
+        }),
+        ('Decision Details', {
+            'fields': ('status', 'impact', 'decided_date', 'decision_maker')
+        }),
+        ('Timeline', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    ]
+
+    def status_badge(self, obj):
+        return render_badge(DECISION_STATUS_BADGES, obj.status)
+    status_badge.short_description = 'Status'
+
+    def impact_badge(self, obj):
+        return render_badge(DECISION_IMPACT_BADGES, obj.impact, BOLD_BADGE_TEMPLATE)
+    impact_badge.short_description = 'Impact'
+
+    def age_display(self, obj):
+        days = obj.days_since_creation
+        if days > 30:
+            color = '#dc3545'  # red
+        elif days > 7:
+            color = '#ffc107'  # yellow
+        else:
+            color = '#28a745'  # green
+        return format_html(
+            '<span style="color: {}; font-weight: bold;">{} days</span>',
+            color, days
+        )
+    age_display.short_description = 'Age'
@@ -0,0 +1,17 @@
+"""Foreign-key list filters labelled the same way as each model's ``__str__``."""
+
+from .changelist import ValuesRelatedFieldListFilter
+
+
+class OwnerListFilter(ValuesRelatedFieldListFilter):
+    label_fields = ('first_name', 'last_name', 'username')
+    label_format = '{} {} ({})'
+
+
+class ProjectListFilter(ValuesRelatedFieldListFilter):
+    label_fields = ('name',)
+
+
+class ApplicationListFilter(ValuesRelatedFieldListFilter):
+    label_fields = ('project__name', 'name')
+    label_format = '{} - {}'
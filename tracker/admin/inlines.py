@@ -0,0 +1,53 @@
+from django.contrib import admin
+from django.forms.models import BaseInlineFormSet
+
+from ..models import Application, Artifact, Task
+
+
+class LimitedInlineFormSet(BaseInlineFormSet):
+    """Inline formset that only edits the first ``max_rows`` related objects."""
+    max_rows = 25
+
+    def get_queryset(self):
+        # The formset indexes get_queryset() once per form, so evaluate the
+        # slice once; a fresh slice would run a LIMIT query on every access
+        if not hasattr(self, '_limited_queryset'):
+            self._limited_queryset = list(super().get_queryset()[:self.max_rows])
+            # Every row points at the parent, so reuse it rather than letting
+            # each row's label load it again
+            for obj in self._limited_queryset:
+                setattr(obj, self.fk.name, self.instance)
+        return self._limited_queryset
+
+
+class ApplicationInline(admin.TabularInline):
+    model = Application
+    formset = LimitedInlineFormSet
+    extra = 0
+    fields = ['name', 'status', 'complexity', 'estimated_weeks']
+    show_change_link = True
+
+    def get_queryset(self, request):
+        # Most recently updated first, so the capped formset shows active applications.
+        return super().get_queryset(request).defer('description', 'features').order_by('-updated_at', '-pk')
+
+
+class ArtifactInline(admin.TabularInline):
+    model = Artifact
+    extra = 0
+    fields = ['name', 'type', 'status', 'version']
+    show_change_link = True
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('description', 'content')
+
+
+class TaskInline(admin.TabularInline):
+    model = Task
+    extra = 0
+    fields = ['title', 'status', 'priority', 'assignee', 'due_date']
+    readonly_fields = ['is_overdue']
+    show_change_link = True
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('description')
@@ -0,0 +1,111 @@
+from functools import cache
+
+from django.contrib import admin
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import format_html
+
+from ..models import Integration
+from .badges import (
+    BOLD_BADGE_TEMPLATE,
+    INTEGRATION_COMPLEXITY_BADGES,
+    INTEGRATION_TYPE_BADGES,
+    render_badge,
+)
+from .changelist import EstimatedCountPaginator, TrackerChangeListMixin
+from .filters import ProjectListFilter
+
+
+APPLICATION_LINK_TEMPLATE = '<a href="{}" title="View application">{}</a>'
+
+
+@cache
+def _change_url_parts(viewname):
+    prefix, suffix = reverse(viewname, args=[0]).rsplit('/0/', 1)
+    return f'{prefix}/', f'/{suffix}'
+
+
+def change_url(viewname, pk):
+    """Build an admin change URL from a prefix/suffix reversed once per view name."""
+    prefix, suffix = _change_url_parts(viewname)
+    return f'{prefix}{pk}{suffix}'
+
+
+@admin.register(Integration)
+class IntegrationAdmin(TrackerChangeListMixin, admin.ModelAdmin):
+    list_display = ['integration_name', 'from_application', 'to_application', 'integration_type_badge', 'complexity_badge', 'estimated_hours']
+    list_filter = ['integration_type', 'complexity', ('from_app__project', ProjectListFilter)]
+    search_fields = ['description', 'from_app__name', 'to_app__name']
+    list_select_related = ['from_app', 'to_app']
+    autocomplete_fields = ['from_app', 'to_app']
+    list_defer = [
+        'description',
+        'from_app__description', 'from_app__features', 'to_app__description', 'to_app__features',
+    ]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 200
+    keyset_field = 'created_at'
+    readonly_fields = ['created_at', 'updated_at', 'estimated_hours']
+    
+    fieldsets = [
+        ('Integration Overview', {
+            'fields': ('description',)
+        }),
+        ('Integration Details', {
+            'fields': ('from_app', 'to_app', 'integration_type', 'status')
+        }),
+        ('Planning', {
+            'fields': ('complexity', 'estimated_weeks', 'estimated_hours')
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    ]
+
+    actions = ['mark_as_in_progress', 'mark_as_completed', 'mark_as_blocked']
+
+    def from_application(self, obj):
+        return format_html(
+            APPLICATION_LINK_TEMPLATE,
+            change_url('admin:tracker_application_change', obj.from_app_id),
+            obj.from_app.name
+        )
+    from_application.short_description = 'From App'
+
+    def to_application(self, obj):
+        return format_html(
+            APPLICATION_LINK_TEMPLATE,
+            change_url('admin:tracker_application_change', obj.to_app_id),
+            obj.to_app.name
+        )
+    to_application.short_description = 'To App'
+
+    def integration_name(self, obj):
+        return f"{obj.from_app.name} → {obj.to_app.name}"
+    integration_name.short_description = 'Integration'
+
+    def integration_type_badge(self, obj):
+        return render_badge(INTEGRATION_TYPE_BADGES, obj.integration_type)
+    integration_type_badge.short_description = 'Type'
+
+    def complexity_badge(self, obj):
+        return render_badge(INTEGRATION_COMPLEXITY_BADGES, obj.complexity, BOLD_BADGE_TEMPLATE)
+    complexity_badge.short_description = 'Complexity'
+
+    def mark_as_in_progress(self, request, queryset):
+        updated = queryset.update(status='in-progress', updated_at=timezone.now())
+        self.message_user(request, f'{updated} integrations marked as in progress.')
+    mark_as_in_progress.short_description = "Mark selected integrations as in progress"
+
+    def mark_as_completed(self, request, queryset):
+        updated = queryset.update(status='completed', updated_at=timezone.now())
+        self.message_user(request, f'{updated} integrations marked as completed.')
+    mark_as_completed.short_description = "Mark selected integrations as completed"
+
+    def mark_as_blocked(self, request, queryset):
+        updated = queryset.update(status='blocked', updated_at=timezone.now())
+        self.message_user(request, f'{updated} integrations marked as blocked.')
+    mark_as_blocked.short_description = "Mark selected integrations as blocked"
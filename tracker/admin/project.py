@@ -0,0 +1,116 @@
+from django.contrib import admin
+from django.db.models import Case, Count, F, FloatField, Q, Value, When
+from django.db.models.functions import Cast
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import format_html
+
+from ..models import Project
+from .badges import (
+    PROJECT_PROGRESS_TEMPLATE,
+    PROJECT_STATUS_BADGES,
+    progress_bar,
+    render_badge,
+)
+from .changelist import TrackerChangeListMixin
+from .filters import OwnerListFilter
+from .inlines import ApplicationInline
+
+
+@admin.register(Project)
+class ProjectAdmin(TrackerChangeListMixin, admin.ModelAdmin):
+    list_display = ['name', 'status_badge', 'start_date', 'target_date', 'owner', 'completion_display', 'applications_count']
+    list_filter = ['status', ('owner', OwnerListFilter), 'start_date', 'created_at']
+    search_fields = ['name', 'description']
+    list_select_related = ['owner']
+    autocomplete_fields = ['owner']
+    list_defer = ['description', 'owner__bio']
+    # Aggregate annotations drop Meta.ordering, so restate it here.
+    ordering = ['-created_at']
+    keyset_field = 'created_at'
+    readonly_fields = ['created_at', 'updated_at', 'completion_display', 'overdue_tasks_display', 'applications_link']
+    inlines = [ApplicationInline]
+    
+    fieldsets = [
+        ('Basic Information', {
+            'fields': ('name', 'description', 'owner')
+        }),
+        ('Project Timeline', {
+            'fields': ('status', 'start_date', 'target_date')
+        }),
+        ('Statistics', {
+            'fields': ('completion_display', 'overdue_tasks_display', 'applications_link'),
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    ]
+
+    actions = ['mark_as_active', 'mark_as_completed', 'mark_as_on_hold']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _applications_count=Count('applications', distinct=True),
+            _total_tasks=Count('applications__tasks', distinct=True),
+            _completed_tasks=Count(
+                'applications__tasks',
+                filter=Q(applications__tasks__status='completed'),
+                distinct=True,
+            ),
+            _overdue_tasks=Count(
+                'applications__tasks',
+                filter=Q(
+                    applications__tasks__due_date__lt=timezone.now().date(),
+                    applications__tasks__status__in=['pending', 'in-progress'],
+                ),
+                distinct=True,
+            ),
+        ).annotate(
+            _completion=Case(
+                When(_total_tasks=0, then=Value(0.0)),
+                default=Cast('_completed_tasks', FloatField()) * 100.0 / Cast(F('_total_tasks'), FloatField()),
+                output_field=FloatField(),
+            ),
+        )
+
+    def status_badge(self, obj):
+        return render_badge(PROJECT_STATUS_BADGES, obj.status)
+    status_badge.short_description = 'Status'
+
+    def completion_display(self, obj):
+        return progress_bar(round(obj._completion), PROJECT_PROGRESS_TEMPLATE)
+    completion_display.short_description = 'Completion'
+    completion_display.admin_order_field = '_completion'
+
+    def applications_count(self, obj):
+        return obj._applications_count
+    applications_count.short_description = 'Apps'
+    applications_count.admin_order_field = '_applications_count'
+
+    def applications_link(self, obj):
+        url = reverse('admin:tracker_application_changelist')
+        return format_html(
+            '<a href="{}?project__id__exact={}">View all {} applications</a>',
+            url, obj.pk, obj._applications_count
+        )
+    applications_link.short_description = 'Applications'
+
+    def overdue_tasks_display(self, obj):
+        return obj._overdue_tasks
+    overdue_tasks_display.short_description = 'Overdue tasks'
+
+    def mark_as_active(self, request, queryset):
+        updated = queryset.update(status='development', updated_at=timezone.now())
+        self.message_user(request, f'{updated} projects marked as active.')
+    mark_as_active.short_description = "Mark selected projects as active"
+
+    def mark_as_completed(self, request, queryset):
+        updated = queryset.update(status='completed', updated_at=timezone.now())
+        self.message_user(request, f'{updated} projects marked as completed.')
+    mark_as_completed.short_description = "Mark selected projects as completed"
+
+    def mark_as_on_hold(self, request, queryset):
+        updated = queryset.update(status='on-hold', updated_at=timezone.now())
+        self.message_user(request, f'{updated} projects marked as on-hold.')
+    mark_as_on_hold.short_description = "Mark selected projects as on-hold"
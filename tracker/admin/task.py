@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+from django.contrib import admin
+from django.db.models import BooleanField, Case, Value, When
+from django.utils import timezone
+
+from ..models import Task, tasks_changed
+from .badges import (
+    BOLD_BADGE_TEMPLATE,
+    DUE_SOON_INDICATOR,
+    NO_DUE_DATE_INDICATOR,
+    ON_TRACK_INDICATOR,
+    OVERDUE_INDICATOR,
+    TASK_ASSIGNEE_BADGES,
+    TASK_PRIORITY_BADGES,
+    TASK_STATUS_BADGES,
+    render_badge,
+)
+from .changelist import EstimatedCountPaginator, TrackerChangeListMixin
+from .filters import ApplicationListFilter
+
+
+@admin.register(Task)
+class TaskAdmin(TrackerChangeListMixin, admin.ModelAdmin):
+    list_display = ['title', 'application', 'priority_badge', 'status_badge', 'assignee_badge', 'due_date', 'overdue_indicator']
+    list_filter = [
+        ('application', ApplicationListFilter), 'priority', 'status', 'assignee', 'due_date', 'created_at',
+    ]
+    search_fields = ['title', 'description', 'application__name']
+    list_select_related = ['application', 'application__project']
+    autocomplete_fields = ['application']
+    list_defer = [
+        'description',
+        'application__description', 'application__features', 'application__project__description',
+    ]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 200
+    keyset_field = 'created_at'
+    readonly_fields = ['created_at', 'updated_at', 'is_overdue']
+    
+    fieldsets = [
+        ('Basic Information', {
+            'fields': ('application', 'title', 'description')
+        }),
+        ('Task Details', {
+            'fields': ('priority', 'status', 'assignee', 'due_date')
+        }),
+        ('Time Tracking', {
+            'fields': ('estimated_hours', 'actual_hours'),
+            'classes': ('collapse',)
+        }),
+        ('Status Information', {
+            'fields': ('is_overdue',),
+            'classes': ('collapse',)
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    ]
+
+    actions = ['mark_as_pending', 'mark_as_in_progress', 'mark_as_completed', 'mark_as_blocked']
+
+    def get_queryset(self, request):
+        today = timezone.now().date()
+        return super().get_queryset(request).annotate(
+            _overdue=Case(
+                When(
+                    due_date__lt=today,
+                    status__in=['pending', 'in-progress'],
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            _due_soon=Case(
+                When(due_date__lte=today + timedelta(days=1), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        )
+
+    def priority_badge(self, obj):
+        return render_badge(TASK_PRIORITY_BADGES, obj.priority, BOLD_BADGE_TEMPLATE)
+    priority_badge.short_description = 'Priority'
+
+    def status_badge(self, obj):
+        return render_badge(TASK_STATUS_BADGES, obj.status)
+    status_badge.short_description = 'Status'
+
+    def assignee_badge(self, obj):
+        return render_badge(TASK_ASSIGNEE_BADGES, obj.assignee)
+    assignee_badge.short_description = 'Assignee'
+
+    def overdue_indicator(self, obj):
+        if obj._overdue:
+            return OVERDUE_INDICATOR
+        elif obj.due_date:
+            return DUE_SOON_INDICATOR if obj._due_soon else ON_TRACK_INDICATOR
+        return NO_DUE_DATE_INDICATOR
+    overdue_indicator.short_description = 'Due Status'
+
+    def _update_status(self, queryset, status):
+        # Collect the ids first: the changelist filters may no longer match
+        # the rows once their status changes
+        pks = list(queryset.values_list('pk', flat=True))
+        updated = queryset.update(status=status, updated_at=timezone.now())
+        tasks_changed(Task.objects.filter(pk__in=pks))
+        return updated
+
+    def mark_as_pending(self, request, queryset):
+        updated = self._update_status(queryset, 'pending')
+        self.message_user(request, f'{updated} tasks marked as pending.')
+    mark_as_pending.short_description = "Mark selected tasks as pending"
+
+    def mark_as_in_progress(self, request, queryset):
+        updated = self._update_status(queryset, 'in-progress')
+        self.message_user(request, f'{updated} tasks marked as in progress.')
+    mark_as_in_progress.short_description = "Mark selected tasks as in progress"
+
+    def mark_as_completed(self, request, queryset):
+        updated = self._update_status(queryset, 'completed')
+        self.message_user(request, f'{updated} tasks marked as completed.')
+    mark_as_completed.short_description = "Mark selected tasks as completed"
+
+    def mark_as_blocked(self, request, queryset):
+        updated = self._update_status(queryset, 'blocked')
+        self.message_user(request, f'{updated} tasks marked as blocked.')
+    mark_as_blocked.short_description = "Mark selected tasks as blocked"
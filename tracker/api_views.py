@@ -4,20 +4,79 @@ FamilyHub Development Tracker - API Views
 RESTful API endpoints for AJAX functionality and real-time updates.
 All endpoints return JSON responses and require authentication.
 """
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.contrib.auth.decorators import login_required
-from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Q, Count, Avg, Sum
+from django.db.models import CharField, F, Func, IntegerField, OuterRef, Q, Count, Avg, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Concat, Substr
 from django.core.serializers import serialize
 from django.core.paginator import Paginator
+import hashlib
 import json
+from functools import wraps
 from datetime import datetime, timedelta
 
-from .models import Project, Application, Artifact, Task, Decision, Integration
+from .models import (
+    Activity, Project, Application, Artifact, Task, Decision, Integration, tasks_changed,
+)
+from .signals import PROJECT_STATUS_DISTRIBUTION_CACHE_KEY
 from .views import dashboard_view, api_chart_data, api_stats
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class SubqueryCount(Subquery):
+    """Row count of a correlated queryset as a scalar subquery."""
+    template = '(SELECT COUNT(*) FROM (%(subquery)s) _count)'
+    output_field = IntegerField()
+
+
+class JSONArrayLength(Func):
+    """Length of a JSON array column, computed in the database."""
+    function = 'JSON_ARRAY_LENGTH'
+    output_field = IntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSONB_ARRAY_LENGTH', **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSON_LENGTH', **extra_context)
+
+
+def json_body(view):
+    """
+    Parse the request body as a JSON object into request.json, answering
+    400 before the view runs when the body is malformed or not an object.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            request.json = json.loads(request.body)
+        except ValueError:
+            request.json = None
+        if not isinstance(request.json, dict):
+            return JsonResponse({
+                'success': False,
+                'message': 'Request body must be a JSON object'
+            }, status=400)
+        return view(request, *args, **kwargs)
+    return wrapper
+
+
+def fast_json_response(data):
+    """
+    JSON response for the large list payloads, serialized with orjson when
+    it is installed. Dates and datetimes can be passed through unformatted.
+    """
+    if orjson is None:
+        return JsonResponse(data)
+    return HttpResponse(orjson.dumps(data), content_type='application/json')
+
 
 # ==========================================
 # DASHBOARD API ENDPOINTS
@@ -39,63 +98,97 @@ def api_dashboard_chart_data(request):
 # SEARCH API ENDPOINTS
 # ==========================================
 
+# Seconds a user's search results are reused for an identical query
+SEARCH_CACHE_TIMEOUT = 10
+
+SEARCH_RESULT_URLS = {
+    'project': '/tracker/projects/{}/',
+    'application': '/tracker/apps/{}/',
+    'task': '/tracker/tasks/{}/',
+}
+
+
 @login_required
 def api_search(request):
     """Global search across all models."""
     query = request.GET.get('q', '').strip()
-    
-    if not query:
+
+    if len(query) < 2:
         return JsonResponse({'results': []})
-    
-    results = []
-    
-    # Search projects
-    projects = Project.objects.filter(
+
+    # Typing fires one request per keystroke; repeats of the same query
+    # from the same user are answered from the cache for a few seconds
+    digest = hashlib.md5(query.lower().encode()).hexdigest()
+    results = cache.get_or_set(
+        f'tracker:api:search:{request.user.pk}:{digest}',
+        lambda: _search_results(query),
+        SEARCH_CACHE_TIMEOUT,
+    )
+
+    return fast_json_response({'results': results})
+
+
+def _search_results(query):
+    """Up to five matching projects, applications and tasks as result dicts."""
+    # One UNION ALL round trip; each branch projects the same columns and
+    # takes its first five matches through a pk__in subquery, since SQLite
+    # rejects LIMIT on the branches of a compound statement
+    no_value = Value(None, output_field=CharField())
+    projects = Project.objects.filter(pk__in=Project.objects.filter(
         Q(name__icontains=query) | Q(description__icontains=query)
-    )[:5]
-    
-    for project in projects:
-        results.append({
-            'type': 'project',
-            'id': project.id,
-            'title': project.name,
-            'description': project.description[:100],
-            'url': f'/tracker/projects/{project.id}/',
-            'status': project.status,
-        })
-    
-    # Search applications
-    applications = Application.objects.filter(
+    ).values('pk')[:5]).annotate(
+        _type=Value('project', output_field=CharField()),
+        _title=F('name'),
+        _description=Substr('description', 1, 100),
+        _status=F('status'),
+        _priority=no_value,
+        _project=no_value,
+    )
+    applications = Application.objects.filter(pk__in=Application.objects.filter(
         Q(name__icontains=query) | Q(description__icontains=query)
-    )[:5]
-    
-    for app in applications:
-        results.append({
-            'type': 'application',
-            'id': app.id,
-            'title': app.name,
-            'description': app.description[:100],
-            'url': f'/tracker/apps/{app.id}/',
-            'project': app.project.name,
-        })
-    
-    # Search tasks
-    tasks = Task.objects.filter(
+    ).values('pk')[:5]).annotate(
+        _type=Value('application', output_field=CharField()),
+        _title=F('name'),
+        _description=Substr('description', 1, 100),
+        _status=no_value,
+        _priority=no_value,
+        _project=F('project__name'),
+    )
+    tasks = Task.objects.filter(pk__in=Task.objects.filter(
         Q(title__icontains=query) | Q(description__icontains=query)
-    )[:5]
-    
-    for task in tasks:
-        results.append({
-            'type': 'task',
-            'id': task.id,
-            'title': task.title,
-            'description': task.description[:100],
-            'url': f'/tracker/tasks/{task.id}/',
-            'status': task.status,
-            'priority': task.priority,
-        })
-    
-    return JsonResponse({'results': results})
+    ).values('pk')[:5]).annotate(
+        _type=Value('task', output_field=CharField()),
+        _title=F('title'),
+        _description=Substr('description', 1, 100),
+        _status=F('status'),
+        _priority=F('priority'),
+        _project=no_value,
+    )
+    columns = ('id', '_type', '_title', '_description', '_status', '_priority', '_project')
+    rows = projects.order_by().values(*columns).union(
+        applications.order_by().values(*columns),
+        tasks.order_by().values(*columns),
+        all=True,
+    )
+
+    results = []
+    for row in rows:
+        result = {
+            'type': row['_type'],
+            'id': row['id'],
+            'title': row['_title'],
+            'description': row['_description'],
+            'url': SEARCH_RESULT_URLS[row['_type']].format(row['id']),
+        }
+        if row['_type'] == 'application':
+            result['project'] = row['_project']
+        else:
+            result['status'] = row['_status']
+        if row['_type'] == 'task':
+            result['priority'] = row['_priority']
+        results.append(result)
+
+    return results
 
 
 @login_required
@@ -106,16 +199,19 @@ def api_search_suggestions(request):
     if len(query) < 2:
         return JsonResponse({'suggestions': []})
     
-    suggestions = []
-    
-    # Project suggestions
-    projects = Project.objects.filter(name__icontains=query)[:3]
-    suggestions.extend([f"Project: {p.name}" for p in projects])
-    
-    # Application suggestions
-    apps = Application.objects.filter(name__icontains=query)[:3]
-    suggestions.extend([f"App: {a.name}" for a in apps])
-    
+    # Project and application suggestions in one UNION ALL
+    projects = Project.objects.filter(
+        pk__in=Project.objects.filter(name__icontains=query).values('pk')[:3]
+    ).annotate(
+        label=Concat(Value('Project: '), 'name', output_field=CharField())
+    ).values_list('label', flat=True)
+    apps = Application.objects.filter(
+        pk__in=Application.objects.filter(name__icontains=query).values('pk')[:3]
+    ).annotate(
+        label=Concat(Value('App: '), 'name', output_field=CharField())
+    ).values_list('label', flat=True)
+    suggestions = list(projects.order_by().union(apps.order_by(), all=True))
+
     return JsonResponse({'suggestions': suggestions})
 
 
@@ -123,163 +219,183 @@ def api_search_suggestions(request):
 # TASK API ENDPOINTS
 # ==========================================
 
+# Bulk update actions mapped to the Task field they write
+BULK_UPDATE_FIELDS = {
+    'status': 'status',
+    'priority': 'priority',
+    'assignee': 'assignee',
+}
+
+
 @login_required
 @require_http_methods(["POST"])
-@csrf_exempt
+@json_body
 def api_task_bulk_update(request):
-    """Bulk update task status or assignment."""
-    try:
-        data = json.loads(request.body)
-        task_ids = data.get('task_ids', [])
-        action = data.get('action')
-        value = data.get('value')
-        
-        tasks = Task.objects.filter(id__in=task_ids)
-        
-        if action == 'status':
-            tasks.update(status=value, updated_at=timezone.now())
-        elif action == 'priority':
-            tasks.update(priority=value, updated_at=timezone.now())
-        elif action == 'assigned_to':
-            tasks.update(assigned_to_id=value, updated_at=timezone.now())
-        
+    """Bulk update task status, priority or assignee."""
+    task_ids = request.json.get('task_ids', [])
+    action = request.json.get('action')
+    value = request.json.get('value')
+
+    if not isinstance(task_ids, list) or not all(
+        isinstance(task_id, int) and not isinstance(task_id, bool) for task_id in task_ids
+    ):
         return JsonResponse({
-            'success': True,
-            'message': f'Updated {tasks.count()} tasks'
-        })
-        
-    except Exception as e:
+            'success': False,
+            'message': 'task_ids must be a list of task IDs'
+        }, status=400)
+
+    if action not in BULK_UPDATE_FIELDS:
         return JsonResponse({
             'success': False,
-            'message': str(e)
+            'message': f'Unknown action: {action}'
         }, status=400)
 
+    field = BULK_UPDATE_FIELDS[action]
+    if value not in dict(Task._meta.get_field(field).choices):
+        return JsonResponse({
+            'success': False,
+            'message': f'Invalid {field}: {value}'
+        }, status=400)
+
+    # update() returns the affected row count, so no follow-up COUNT
+    updated = 0
+    if task_ids:
+        updated = Task.objects.filter(id__in=task_ids).update(
+            **{field: value, 'updated_at': timezone.now()}
+        )
+        tasks_changed(Task.objects.filter(id__in=task_ids))
+
+    return JsonResponse({
+        'success': True,
+        'message': f'Updated {updated} tasks'
+    })
+
 
 @login_required
 @require_http_methods(["POST"])
-@csrf_exempt
+@json_body
 def api_task_status_update(request, pk):
     """Update individual task status."""
-    try:
-        task = Task.objects.get(pk=pk)
-        data = json.loads(request.body)
-        new_status = data.get('status')
-        
-        task.status = new_status
-        task.updated_at = timezone.now()
-        task.save()
-        
+    new_status = request.json.get('status')
+    status_labels = dict(Task.STATUS_CHOICES)
+
+    if new_status not in status_labels:
         return JsonResponse({
-            'success': True,
-            'status': task.get_status_display()
-        })
-        
-    except Task.DoesNotExist:
+            'success': False,
+            'message': 'Invalid status'
+        }, status=400)
+
+    # Single UPDATE; the affected row count doubles as the existence check
+    if not Task.objects.filter(pk=pk).update(status=new_status, updated_at=timezone.now()):
         return JsonResponse({
             'success': False,
             'message': 'Task not found'
         }, status=404)
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'message': str(e)
-        }, status=400)
+    tasks_changed(Task.objects.filter(pk=pk))
+
+    return JsonResponse({
+        'success': True,
+        'status': status_labels[new_status]
+    })
 
 
 @login_required
 def api_task_kanban_data(request):
     """Get tasks organized by status for kanban board."""
-    tasks_by_status = {}
-    
-    statuses = ['todo', 'in_progress', 'testing', 'completed']
-    
-    for status in statuses:
-        tasks = Task.objects.filter(status=status).select_related(
-            'project', 'application', 'assigned_to'
-        )
-        
-        tasks_data = []
-        for task in tasks:
-            tasks_data.append({
-                'id': task.id,
-                'title': task.title,
-                'description': task.description[:100],
-                'priority': task.priority,
-                'assigned_to': task.assigned_to.username if task.assigned_to else None,
-                'project': task.project.name if task.project else None,
-                'application': task.application.name if task.application else None,
-                'due_date': task.due_date.isoformat() if task.due_date else None,
-            })
-        
-        tasks_by_status[status] = tasks_data
-    
-    return JsonResponse(tasks_by_status)
+    statuses = [status for status, _ in Task.STATUS_CHOICES]
+    tasks_by_status = {status: [] for status in statuses}
+
+    # One query for every column, bucketed by status in a single pass
+    tasks = Task.objects.filter(status__in=statuses).values(
+        'id', 'title', 'priority', 'status', 'assignee', 'due_date',
+        'application__name', 'application__project__name',
+        summary=Substr('description', 1, 100),
+    )
+
+    for task in tasks:
+        tasks_by_status[task['status']].append({
+            'id': task['id'],
+            'title': task['title'],
+            'description': task['summary'],
+            'priority': task['priority'],
+            'assignee': task['assignee'],
+            'project': task['application__project__name'],
+            'application': task['application__name'],
+            'due_date': task['due_date'],
+        })
+
+    return fast_json_response(tasks_by_status)
 
 
 @login_required
 @require_http_methods(["POST"])
-@csrf_exempt
+@json_body
 def api_task_assign(request, pk):
-    """Assign task to user."""
-    try:
-        task = Task.objects.get(pk=pk)
-        data = json.loads(request.body)
-        assigned_to_id = data.get('assigned_to_id')
-        
-        if assigned_to_id:
-            from django.contrib.auth.models import User
-            user = User.objects.get(pk=assigned_to_id)
-            task.assigned_to = user
-        else:
-            task.assigned_to = None
-        
-        task.updated_at = timezone.now()
-        task.save()
-        
+    """Assign task to an assignee."""
+    assignee = request.json.get('assignee')
+
+    if assignee not in dict(Task.ASSIGNEE_CHOICES):
         return JsonResponse({
-            'success': True,
-            'assigned_to': task.assigned_to.username if task.assigned_to else None
-        })
-        
-    except (Task.DoesNotExist, User.DoesNotExist):
+            'success': False,
+            'message': 'Invalid assignee'
+        }, status=400)
+
+    if not Task.objects.filter(pk=pk).update(assignee=assignee, updated_at=timezone.now()):
         return JsonResponse({
             'success': False,
-            'message': 'Task or user not found'
+            'message': 'Task not found'
         }, status=404)
+    tasks_changed(Task.objects.filter(pk=pk))
+
+    return JsonResponse({
+        'success': True,
+        'assignee': assignee
+    })
 
 
 # ==========================================
 # PROJECT API ENDPOINTS
 # ==========================================
 
+# Seconds the status distribution is cached; saves and deletes also clear it
+PROJECT_STATUS_DISTRIBUTION_TIMEOUT = 60
+
 @login_required
 def api_project_progress(request, pk):
     """Get detailed project progress data."""
     try:
         project = Project.objects.get(pk=pk)
-        
-        # Calculate application progress
+        applications = project.applications.annotate(
+            total_tasks=Count('tasks'),
+            completed_tasks=Count('tasks', filter=Q(tasks__status='completed')),
+        ).order_by('name')
+
+        # Calculate application progress; project totals are summed from
+        # the same annotated rows instead of being counted again
         apps_data = []
-        for app in project.applications.all():
-            total_tasks = app.task_set.count()
-            completed_tasks = app.task_set.filter(status='completed').count()
-            progress = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-            
+        total_tasks = completed_tasks = 0
+        for app in applications:
+            progress = (app.completed_tasks / app.total_tasks * 100) if app.total_tasks > 0 else 0
+            total_tasks += app.total_tasks
+            completed_tasks += app.completed_tasks
+
             apps_data.append({
                 'name': app.name,
                 'progress': round(progress, 1),
-                'total_tasks': total_tasks,
-                'completed_tasks': completed_tasks,
+                'total_tasks': app.total_tasks,
+                'completed_tasks': app.completed_tasks,
                 'status': app.status,
             })
-        
+
+        completion = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+
         return JsonResponse({
             'project': {
                 'name': project.name,
-                'completion_percentage': project.completion_percentage,
+                'completion_percentage': round(completion, 1),
                 'applications': apps_data,
-                'total_tasks': project.total_tasks,
-                'completed_tasks': project.completed_tasks,
+                'total_tasks': total_tasks,
+                'completed_tasks': completed_tasks,
             }
         })
         
@@ -293,23 +409,33 @@ def api_project_progress(request, pk):
 def api_project_statistics(request, pk):
     """Get project statistics."""
     try:
-        project = Project.objects.get(pk=pk)
-        
+        today = timezone.now().date()
+        # Tasks share the applications join; artifacts and decisions are
+        # counted in subqueries so their rows don't multiply the join
+        project = Project.objects.only('pk').annotate(
+            applications_count=Count('applications', distinct=True),
+            total_tasks=Count('applications__tasks', distinct=True),
+            completed_tasks=Count(
+                'applications__tasks', filter=Q(applications__tasks__status='completed'), distinct=True
+            ),
+            overdue_tasks=Count('applications__tasks', filter=Q(
+                applications__tasks__due_date__lt=today,
+                applications__tasks__status__in=['pending', 'in-progress'],
+            ), distinct=True),
+            artifacts_count=SubqueryCount(Artifact.objects.filter(application__project=OuterRef('pk'))),
+            decisions_count=SubqueryCount(Decision.objects.filter(project=OuterRef('pk'))),
+        ).get(pk=pk)
+
         stats = {
-            'applications_count': project.applications.count(),
+            'applications_count': project.applications_count,
             'total_tasks': project.total_tasks,
             'completed_tasks': project.completed_tasks,
-            'overdue_tasks': project.task_set.filter(
-                due_date__lt=timezone.now().date(),
-                status__in=['todo', 'in_progress']
-            ).count(),
-            'artifacts_count': Artifact.objects.filter(
-                application__project=project
-            ).count(),
-            'decisions_count': project.decision_set.count(),
-            'team_size': project.team_members.count() if hasattr(project, 'team_members') else 1,
+            'overdue_tasks': project.overdue_tasks,
+            'artifacts_count': project.artifacts_count,
+            'decisions_count': project.decisions_count,
+            'team_size': 1,
         }
-        
+
         return JsonResponse(stats)
         
     except Project.DoesNotExist:
@@ -321,12 +447,16 @@ def api_project_statistics(request, pk):
 @login_required
 def api_project_status_distribution(request):
     """Get distribution of projects by status."""
-    distribution = Project.objects.values('status').annotate(
-        count=Count('id')
-    ).order_by('status')
-    
+    distribution = cache.get_or_set(
+        PROJECT_STATUS_DISTRIBUTION_CACHE_KEY,
+        lambda: list(Project.objects.values('status').annotate(
+            count=Count('id')
+        ).order_by('status')),
+        PROJECT_STATUS_DISTRIBUTION_TIMEOUT,
+    )
+
     return JsonResponse({
-        'distribution': list(distribution)
+        'distribution': distribution
     })
 
 
@@ -338,19 +468,25 @@ def api_project_status_distribution(request):
 def api_application_metrics(request, pk):
     """Get application metrics."""
     try:
-        app = Application.objects.get(pk=pk)
-        
+        latest_artifacts = Artifact.objects.filter(application=OuterRef('pk')).order_by('-updated_at', '-pk')
+        app = Application.objects.only('pk').annotate(
+            tasks_total=Count('tasks', distinct=True),
+            tasks_completed=Count('tasks', filter=Q(tasks__status='completed'), distinct=True),
+            artifacts_count=Count('artifacts', distinct=True),
+            latest_version=Subquery(latest_artifacts.values('version')[:1]),
+            features_count=Coalesce(JSONArrayLength('features'), 0),
+        ).get(pk=pk)
+
         metrics = {
-            'tasks_total': app.task_set.count(),
-            'tasks_completed': app.task_set.filter(status='completed').count(),
-            'artifacts_count': app.artifact_set.count(),
-            'latest_version': app.version,
-            'features_count': len(app.features) if app.features else 0,
-            'tech_stack_count': len(app.tech_stack) if app.tech_stack else 0,
+            'tasks_total': app.tasks_total,
+            'tasks_completed': app.tasks_completed,
+            'artifacts_count': app.artifacts_count,
+            'latest_version': app.latest_version,
+            'features_count': app.features_count,
         }
-        
+
         return JsonResponse(metrics)
-        
+
     except Application.DoesNotExist:
         return JsonResponse({
             'error': 'Application not found'
@@ -376,82 +512,97 @@ def api_application_technology_stats(request):
 # WIDGET API ENDPOINTS
 # ==========================================
 
+ACTIVITY_URLS = {
+    'task': '/tracker/tasks/{}/',
+    'artifact': '/tracker/artifacts/{}/',
+    'decision': '/tracker/decisions/{}/',
+}
+
+
 @login_required
 def api_widget_recent_activity(request):
     """Get recent activity for dashboard widget."""
     limit = int(request.GET.get('limit', 10))
-    
-    # Get recent tasks, artifacts, and decisions
-    recent_tasks = Task.objects.select_related(
-        'project', 'application'
-    ).order_by('-updated_at')[:limit]
-    
+
+    # Tasks, artifacts and decisions share one denormalized feed table,
+    # kept current by tracker.signals and tasks_changed()
+    recent = Activity.objects.values(
+        'target_type', 'target_id', 'title', 'description', 'status', 'timestamp'
+    )[:limit]
+
     activities = []
-    for task in recent_tasks:
+    for activity in recent:
         activities.append({
-            'type': 'task',
-            'title': task.title,
-            'description': f'in {task.application.name}' if task.application else f'in {task.project.name}',
-            'timestamp': task.updated_at.isoformat(),
-            'url': f'/tracker/tasks/{task.id}/',
-            'status': task.status,
+            'type': activity['target_type'],
+            'title': activity['title'],
+            'description': activity['description'],
+            'timestamp': activity['timestamp'],
+            'url': ACTIVITY_URLS[activity['target_type']].format(activity['target_id']),
+            'status': activity['status'],
         })
-    
-    return JsonResponse({'activities': activities})
+
+    return fast_json_response({'activities': activities})
 
 
 @login_required
 def api_widget_overdue_tasks(request):
     """Get overdue tasks for dashboard widget."""
+    today = timezone.now().date()
     overdue_tasks = Task.objects.filter(
-        due_date__lt=timezone.now().date(),
-        status__in=['todo', 'in_progress']
-    ).select_related('project', 'application')[:10]
-    
+        due_date__lt=today,
+        status__in=['pending', 'in-progress']
+    ).values(
+        'id', 'title', 'due_date', 'application__name', 'application__project__name'
+    )[:10]
+
     tasks_data = []
     for task in overdue_tasks:
         tasks_data.append({
-            'id': task.id,
-            'title': task.title,
-            'project': task.project.name if task.project else None,
-            'application': task.application.name if task.application else None,
-            'due_date': task.due_date.isoformat(),
-            'days_overdue': (timezone.now().date() - task.due_date).days,
-            'url': f'/tracker/tasks/{task.id}/',
+            'id': task['id'],
+            'title': task['title'],
+            'project': task['application__project__name'],
+            'application': task['application__name'],
+            'due_date': task['due_date'].isoformat(),
+            'days_overdue': (today - task['due_date']).days,
+            'url': f"/tracker/tasks/{task['id']}/",
         })
-    
+
     return JsonResponse({'overdue_tasks': tasks_data})
 
 
 @login_required
 def api_widget_project_health(request):
     """Get project health indicators."""
-    projects = Project.objects.all()
-    
+    projects = Project.objects.only(
+        'id', 'name', 'status', 'start_date', 'target_date', 'completion_percentage'
+    )
+    today = timezone.now().date()
+
     health_data = []
     for project in projects:
         # Calculate health score based on multiple factors
-        completion_score = project.completion_percentage / 100
-        
+        completion_percentage = project.completion_percentage
+        completion_score = completion_percentage / 100
+
         # Check if project is on schedule
         if project.target_date and project.start_date:
             total_days = (project.target_date - project.start_date).days
-            elapsed_days = (timezone.now().date() - project.start_date).days
+            elapsed_days = (today - project.start_date).days
             expected_progress = (elapsed_days / total_days) * 100 if total_days > 0 else 0
-            schedule_score = min(1.0, project.completion_percentage / expected_progress) if expected_progress > 0 else 1.0
+            schedule_score = min(1.0, completion_percentage / expected_progress) if expected_progress > 0 else 1.0
         else:
             schedule_score = 1.0
-        
+
         # Overall health score (0-100)
         health_score = (completion_score * 0.6 + schedule_score * 0.4) * 100
-        
+
         health_data.append({
             'project_id': project.id,
             'project_name': project.name,
             'health_score': round(health_score, 1),
-            'completion_percentage': project.completion_percentage,
+            'completion_percentage': completion_percentage,
             'status': project.status,
-            'is_overdue': project.target_date < timezone.now().date() if project.target_date else False,
+            'is_overdue': project.target_date < today if project.target_date else False,
         })
     
     return JsonResponse({'project_health': health_data})
@@ -481,48 +632,32 @@ def api_notifications(request):
 
 @login_required
 @require_http_methods(["POST"])
-@csrf_exempt
+@json_body
 def api_notifications_mark_read(request):
     """Mark notifications as read."""
-    try:
-        data = json.loads(request.body)
-        notification_ids = data.get('notification_ids', [])
-        
-        # Placeholder implementation
-        return JsonResponse({
-            'success': True,
-            'marked_count': len(notification_ids)
-        })
-        
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'message': str(e)
-        }, status=400)
+    notification_ids = request.json.get('notification_ids', [])
+
+    # Placeholder implementation
+    return JsonResponse({
+        'success': True,
+        'marked_count': len(notification_ids)
+    })
 
 
 @login_required
 @require_http_methods(["POST"])
-@csrf_exempt
+@json_body
 def api_user_theme_toggle(request):
     """Toggle user theme preference."""
-    try:
-        data = json.loads(request.body)
-        theme = data.get('theme', 'light')
-        
-        # Store theme preference (could be in user profile)
-        request.session['theme'] = theme
-        
-        return JsonResponse({
-            'success': True,
-            'theme': theme
-        })
-        
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'message': str(e)
-        }, status=400)
+    theme = request.json.get('theme', 'light')
+
+    # Store theme preference (could be in user profile)
+    request.session['theme'] = theme
+
+    return JsonResponse({
+        'success': True,
+        'theme': theme
+    })
 
 
 @login_required
@@ -5,3 +5,6 @@ class TrackerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tracker'
     verbose_name = 'Development Tracker'
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+CACHED_LOADER = 'django.template.loaders.cached.Loader'
+
+
+@register(Tags.templates)
+def check_cached_template_loader(app_configs, **kwargs):
+    """Warn when production templates are read from disk on every render.
+
+    Crispy renders each form field through several included templates, so
+    without the cached loader a single form page costs dozens of file reads.
+    """
+    if settings.DEBUG:
+        return []
+    warnings = []
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        loaders = [loader[0] if isinstance(loader, (list, tuple)) else loader for loader in engine.engine.loaders]
+        if CACHED_LOADER not in loaders:
+            warnings.append(Warning(
+                f"Template engine '{engine.name}' does not use the cached template loader.",
+                hint=f"Wrap the template loaders in '{CACHED_LOADER}' or remove the 'loaders' option.",
+                id='tracker.W001',
+            ))
+    return warnings
@@ -0,0 +1,93 @@
+"""
+FamilyHub Development Tracker - Export concurrency limit
+
+Each running export holds one of settings.EXPORT_MAX_CONCURRENT slots so
+that parallel exports cannot exhaust memory on a small host. On PostgreSQL
+a slot is a session advisory lock; on other databases it is an flock on a
+file in the temp directory, which covers every process on the machine.
+Without fcntl (Windows) no limit applies and a warning is logged.
+"""
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key of the first slot; slot n uses EXPORT_LOCK_KEY + n
+EXPORT_LOCK_KEY = 0x46484558
+
+# Seconds between attempts while waiting for a free slot
+EXPORT_LOCK_POLL_INTERVAL = 1
+
+
+class ExportSlotUnavailable(Exception):
+    """Every export slot is taken."""
+
+
+@contextmanager
+def export_slot(wait=False):
+    """
+    Hold an export slot for the duration of the block.
+
+    Raises ExportSlotUnavailable when every slot is taken, unless ``wait``
+    is set, in which case it polls until one frees up.
+    """
+    max_concurrent = getattr(settings, 'EXPORT_MAX_CONCURRENT', 1)
+    if max_concurrent < 1:
+        raise ImproperlyConfigured('EXPORT_MAX_CONCURRENT must be at least 1.')
+    if connection.vendor == 'postgresql':
+        lock = _advisory_lock
+    elif fcntl is not None:
+        lock = _file_lock
+    else:
+        logger.warning('File locks are not available on this platform; EXPORT_MAX_CONCURRENT is not enforced.')
+        yield
+        return
+
+    while True:
+        for slot in range(max_concurrent):
+            with lock(slot) as locked:
+                if locked:
+                    yield
+                    return
+        if not wait:
+            raise ExportSlotUnavailable
+        time.sleep(EXPORT_LOCK_POLL_INTERVAL)
+
+
+@contextmanager
+def _advisory_lock(slot):
+    key = EXPORT_LOCK_KEY + slot
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_try_advisory_lock(%s)', [key])
+        locked = cursor.fetchone()[0]
+    try:
+        yield locked
+    finally:
+        if locked:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_unlock(%s)', [key])
+
+
+@contextmanager
+def _file_lock(slot):
+    # Closing the file drops the lock
+    with open(os.path.join(tempfile.gettempdir(), f'familyhub-export-{slot}.lock'), 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            locked = False
+        else:
+            locked = True
+        yield locked
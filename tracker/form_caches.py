@@ -0,0 +1,61 @@
+"""
+FamilyHub Development Tracker - Form choice caches
+
+Select widgets for projects, applications and users render their options
+from the cache instead of querying on every form render. The keys are
+dropped by the signal handlers in tracker.signals whenever a row behind
+them changes.
+"""
+from django import forms
+from django.conf import settings
+from django.core.cache import cache
+from django.forms.models import ModelChoiceIterator
+
+PROJECT_CHOICES_CACHE_KEY = 'tracker:forms:project_choices'
+APPLICATION_CHOICES_CACHE_KEY = 'tracker:forms:application_choices'
+USER_CHOICES_CACHE_KEY = 'tracker:forms:user_choices'
+
+# Caches to drop when a row of each model changes; application labels
+# include the project name, so a project change drops both
+CHOICE_CACHE_KEYS_BY_MODEL = {
+    'tracker.Project': (PROJECT_CHOICES_CACHE_KEY, APPLICATION_CHOICES_CACHE_KEY),
+    'tracker.Application': (APPLICATION_CHOICES_CACHE_KEY,),
+    settings.AUTH_USER_MODEL: (USER_CHOICES_CACHE_KEY,),
+}
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """Yield (pk, label) choices from the cache so rendering the select runs no query."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        yield from self.cached_choices()
+
+    def __len__(self):
+        return len(self.cached_choices()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.cached_choices())
+
+    def cached_choices(self):
+        return cache.get_or_set(self.field.cache_key, self.load_choices, self.field.cache_timeout)
+
+    def load_choices(self):
+        return [(obj.pk, self.field.label_from_instance(obj)) for obj in self.queryset]
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField whose options are cached under ``cache_key``.
+
+    Every field sharing a key must use the same queryset. Submitted values
+    are still looked up against the queryset.
+    """
+
+    iterator = CachedModelChoiceIterator
+
+    def __init__(self, queryset, *, cache_key, cache_timeout=300, **kwargs):
+        self.cache_key = cache_key
+        self.cache_timeout = cache_timeout
+        super().__init__(queryset, **kwargs)
@@ -1,19 +1,153 @@
+import os
+import re
+from functools import partial
+
 from django import forms
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from django.urls import reverse, reverse_lazy
 from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+from django.utils.text import format_lazy
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Layout, Fieldset, Submit, Row, Column, HTML, Field
 from crispy_forms.bootstrap import FormActions
-import json
+from crispy_forms.utils import TEMPLATE_PACK
 from .models import Project, Application, Artifact, Task, Decision, Integration, Requirement
+from .form_caches import (
+    APPLICATION_CHOICES_CACHE_KEY, PROJECT_CHOICES_CACHE_KEY, USER_CHOICES_CACHE_KEY, CachedModelChoiceField,
+)
+
+__all__ = [
+    'ApplicationForm',
+    'ArtifactForm',
+    'BulkTaskForm',
+    'DecisionForm',
+    'IntegrationForm',
+    'ProjectForm',
+    'RequirementForm',
+    'SearchForm',
+    'TaskForm',
+]
 
 User = get_user_model()
 
+ALLOWED_UPLOAD_EXTENSIONS = frozenset({
+    'pdf', 'doc', 'docx', 'txt', 'py', 'js',
+    'html', 'css', 'md', 'json', 'xml',
+})
+ALLOWED_UPLOAD_EXTENSIONS_DISPLAY = ', '.join(sorted(ALLOWED_UPLOAD_EXTENSIONS))
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# The search form renders on every search request, so its chrome is fixed
+# markup rather than a crispy layout; only the three field columns vary
+SEARCH_FORM_SHELL = (
+    '<form method="get" class="form-inline">'
+    '<div class="row">'
+    '<div class="col-md-6 mb-3">{}</div>'
+    '<div class="col-md-3 mb-3">{}</div>'
+    '<div class="col-md-3 mb-3">{}</div>'
+    '</div>'
+    '<div class="mb-3">'
+    '<input type="submit" name="submit" value="Search" class="btn btn-primary">'
+    '<a href="{}" class="btn btn-outline-secondary ms-2">Clear</a>'
+    '</div>'
+    '</form>'
+)
+
+# Widgets shared by the Bootstrap-styled fields below; Django deep-copies a
+# widget into each field, so the instances here are never mutated
+_SELECT = forms.Select(attrs={'class': 'form-select'})
+_DATE_INPUT = forms.DateInput(attrs={'type': 'date', 'class': 'form-control'})
+_TEXT_INPUT = forms.TextInput(attrs={'class': 'form-control'})
+
+# Comma-separated task ids as posted by the bulk action form; blank entries are ignored
+TASK_IDS_RE = re.compile(r'\s*(?:\d+\s*)?(?:,\s*(?:\d+\s*)?)*')
+TASK_ID_RE = re.compile(r'\d+')
+
+VERSION_RE = re.compile(r'(?P<major>\d+)\.(?P<minor>\d+)')
+
+
+class StaticHTML(HTML):
+    """HTML layout node for markup without template tags, rendered without crispy's per-render template parse."""
+
+    @cached_property
+    def rendered(self):
+        return str(self.html)
+
+    def render(self, form, context, template_pack=TEMPLATE_PACK, **kwargs):
+        return self.rendered
+
+
+def link_button(url_name, label, css_class='btn btn-secondary ms-2'):
+    """Static link styled as a button; the URL is reversed on first render."""
+    return StaticHTML(format_lazy('<a href="{}" class="{}">{}</a>', reverse_lazy(url_name), css_class, label))
+
+
+# Layout nodes are never mutated while rendering, so the form actions are
+# built once here and shared by the class-level helpers below.
+_PROJECT_ACTIONS = FormActions(
+    Submit('submit', 'Save Project', css_class='btn btn-primary'),
+    link_button('tracker:project_list', 'Cancel'),
+)
+_APPLICATION_ACTIONS = FormActions(
+    Submit('submit', 'Save Application', css_class='btn btn-primary'),
+    link_button('tracker:application_list', 'Cancel'),
+)
+_ARTIFACT_ACTIONS = FormActions(
+    Submit('submit', 'Save Artifact', css_class='btn btn-primary'),
+    link_button('tracker:artifact_list', 'Cancel'),
+)
+_TASK_ACTIONS = FormActions(
+    Submit('submit', 'Save Task', css_class='btn btn-primary'),
+    link_button('tracker:task_list', 'Cancel'),
+)
+_BULK_TASK_ACTIONS = FormActions(
+    Submit('submit', 'Apply Action', css_class='btn btn-warning'),
+)
+_DECISION_ACTIONS = FormActions(
+    Submit('submit', 'Save Decision', css_class='btn btn-primary'),
+    link_button('tracker:decision_list', 'Cancel'),
+)
+_INTEGRATION_ACTIONS = FormActions(
+    Submit('submit', 'Save Integration', css_class='btn btn-primary'),
+    link_button('tracker:integration_list', 'Cancel'),
+)
+_REQUIREMENT_ACTIONS = FormActions(
+    Submit('submit', 'Save Requirement', css_class='btn btn-primary'),
+    link_button('tracker:requirement_list', 'Cancel'),
+)
+
+
+def _project_choice_field(**kwargs):
+    kwargs.setdefault('widget', _SELECT)
+    return CachedModelChoiceField(
+        queryset=Project.objects.only('id', 'name').order_by('name'),
+        cache_key=PROJECT_CHOICES_CACHE_KEY,
+        **kwargs,
+    )
+
+
+def _application_choice_field(**kwargs):
+    # Labels read "<project> - <application>", so the project name comes along
+    kwargs.setdefault('widget', _SELECT)
+    return CachedModelChoiceField(
+        queryset=Application.objects.select_related('project').only('id', 'name', 'project__name'),
+        cache_key=APPLICATION_CHOICES_CACHE_KEY,
+        **kwargs,
+    )
+
 
 class ProjectForm(forms.ModelForm):
     """Form for creating and updating projects."""
-    
+
+    owner = CachedModelChoiceField(
+        queryset=User.objects.only('id', 'username', 'first_name', 'last_name').order_by('username'),
+        cache_key=USER_CHOICES_CACHE_KEY,
+        widget=_SELECT,
+    )
+
     class Meta:
         model = Project
         fields = [
@@ -21,43 +155,34 @@ class ProjectForm(forms.ModelForm):
             'target_date', 'owner'
         ]
         widgets = {
-            'start_date': forms.DateInput(
-                attrs={'type': 'date', 'class': 'form-control'}
-            ),
-            'target_date': forms.DateInput(
-                attrs={'type': 'date', 'class': 'form-control'}
-            ),
+            'start_date': _DATE_INPUT,
+            'target_date': _DATE_INPUT,
             'description': forms.Textarea(
                 attrs={'rows': 4, 'class': 'form-control'}
             ),
-            'status': forms.Select(attrs={'class': 'form-select'}),
-            'owner': forms.Select(attrs={'class': 'form-select'}),
-            'name': forms.TextInput(attrs={'class': 'form-control'}),
+            'status': _SELECT,
+            'name': _TEXT_INPUT,
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Fieldset(
-                'Project Information',
-                Row(
-                    Column('name', css_class='col-md-8'),
-                    Column('owner', css_class='col-md-4'),
-                ),
-                'description',
-                Row(
-                    Column('status', css_class='col-md-4'),
-                    Column('start_date', css_class='col-md-4'),
-                    Column('target_date', css_class='col-md-4'),
-                ),
+    # Crispy only reads the helper while rendering, so every instance can share one
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Fieldset(
+            'Project Information',
+            Row(
+                Column('name', css_class='col-md-8'),
+                Column('owner', css_class='col-md-4'),
             ),
-            FormActions(
-                Submit('submit', 'Save Project', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:project_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
+            'description',
+            Row(
+                Column('status', css_class='col-md-4'),
+                Column('start_date', css_class='col-md-4'),
+                Column('target_date', css_class='col-md-4'),
+            ),
+        ),
+        _PROJECT_ACTIONS,
+    )
 
     def clean(self):
         """Custom validation to ensure target_date is after start_date."""
@@ -87,6 +212,7 @@ class ApplicationForm(forms.ModelForm):
         required=False,
         help_text="Enter each feature on a new line"
     )
+    project = _project_choice_field()
 
     class Meta:
         model = Application
@@ -95,45 +221,43 @@ class ApplicationForm(forms.ModelForm):
             'status', 'estimated_weeks'
         ]
         widgets = {
-            'project': forms.Select(attrs={'class': 'form-select'}),
-            'name': forms.TextInput(attrs={'class': 'form-control'}),
+            'name': _TEXT_INPUT,
             'description': forms.Textarea(attrs={'rows': 4, 'class': 'form-control'}),
-            'complexity': forms.Select(attrs={'class': 'form-select'}),
-            'status': forms.Select(attrs={'class': 'form-select'}),
+            'complexity': _SELECT,
+            'status': _SELECT,
             'estimated_weeks': forms.NumberInput(attrs={'class': 'form-control', 'min': 1}),
         }
 
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Fieldset(
+            'Application Information',
+            Row(
+                Column('project', css_class='col-md-6'),
+                Column('name', css_class='col-md-6'),
+            ),
+            'description',
+            Row(
+                Column('complexity', css_class='col-md-4'),
+                Column('status', css_class='col-md-4'),
+                Column('estimated_weeks', css_class='col-md-4'),
+            ),
+            'features_text',
+            StaticHTML('<small class="text-muted">Suggested weeks based on complexity: Simple (2-4), Medium (4-8), High (8-16)</small>'),
+        ),
+        _APPLICATION_ACTIONS,
+    )
+
+    # Parsed by clean_features_text()
+    _features = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        
-        # Pre-populate features text field if editing
+        # Pre-populate features text field if editing; Django only calls the
+        # initial value when the field is rendered or compared
         if self.instance.pk and self.instance.features:
-            self.fields['features_text'].initial = '\n'.join(self.instance.features)
-        
-        # Set up crispy forms helper
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Fieldset(
-                'Application Information',
-                Row(
-                    Column('project', css_class='col-md-6'),
-                    Column('name', css_class='col-md-6'),
-                ),
-                'description',
-                Row(
-                    Column('complexity', css_class='col-md-4'),
-                    Column('status', css_class='col-md-4'),
-                    Column('estimated_weeks', css_class='col-md-4'),
-                ),
-                'features_text',
-                HTML('<small class="text-muted">Suggested weeks based on complexity: Simple (2-4), Medium (4-8), High (8-16)</small>'),
-            ),
-            FormActions(
-                Submit('submit', 'Save Application', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:application_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
+            self.fields['features_text'].initial = partial('\n'.join, self.instance.features)
 
         # Add JavaScript for complexity-based suggestions
         self.fields['complexity'].widget.attrs.update({
@@ -143,16 +267,15 @@ class ApplicationForm(forms.ModelForm):
     def clean_features_text(self):
         """Convert features text to list format."""
         features_text = self.cleaned_data.get('features_text', '')
-        if features_text:
-            # Split by newlines and filter out empty lines
-            features = [f.strip() for f in features_text.split('\n') if f.strip()]
-            return features
-        return []
+        # Strip each line once and drop the empty ones; save() picks the list up from _features
+        self._features = [feature for feature in (line.strip() for line in features_text.splitlines()) if feature]
+        return self._features
 
     def save(self, commit=True):
         """Save the application with features from text field."""
         instance = super().save(commit=False)
-        instance.features = self.cleaned_data.get('features_text', [])
+        if self._features is not None:
+            instance.features = self._features
         if commit:
             instance.save()
         return instance
@@ -166,6 +289,13 @@ class ArtifactForm(forms.ModelForm):
         initial=False,
         help_text="Check to automatically increment version number"
     )
+    application = _application_choice_field(
+        required=False,
+        widget=forms.Select(attrs={
+            'class': 'form-select',
+            'data-placeholder': 'Select application (optional)'
+        }),
+    )
 
     class Meta:
         model = Artifact
@@ -183,12 +313,8 @@ class ArtifactForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'Enter artifact content here... (required)'
             }),
-            'application': forms.Select(attrs={
-                'class': 'form-select',
-                'data-placeholder': 'Select application (optional)'
-            }),
-            'type': forms.Select(attrs={'class': 'form-select'}),
-            'status': forms.Select(attrs={'class': 'form-select'}),
+            'type': _SELECT,
+            'status': _SELECT,
             'file_upload': forms.FileInput(attrs={
                 'class': 'form-control',
                 'accept': '.pdf,.doc,.docx,.txt,.py,.js,.html,.css,.md'
@@ -200,59 +326,46 @@ class ArtifactForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.attrs = {'enctype': 'multipart/form-data'}
-        
-        # Make application field optional
-        self.fields['application'].required = False
-        
-        self.helper.layout = Layout(
-            Fieldset(
-                'Artifact Information',
-                HTML('<div class="alert alert-info"><i class="bi bi-info-circle me-2"></i><strong>Required:</strong> Name and Content</div>'),
-                'name',
-                'content',
-                HTML('<hr class="my-3">'),
-                HTML('<h6 class="text-muted">Optional Fields</h6>'),
-                Row(
-                    Column('application', css_class='col-md-6'),
-                    Column('type', css_class='col-md-6'),
-                ),
-                Row(
-                    Column('status', css_class='col-md-6'),
-                    Column(Field('increment_version', css_class='form-check-input'), css_class='col-md-6'),
-                ),
-                'file_upload',
-                HTML('<small class="text-muted">Supported formats: PDF, DOC, DOCX, TXT, PY, JS, HTML, CSS, MD (Max 10MB)</small>'),
-                'description',
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.attrs = {'enctype': 'multipart/form-data'}
+    helper.layout = Layout(
+        Fieldset(
+            'Artifact Information',
+            StaticHTML('<div class="alert alert-info"><i class="bi bi-info-circle me-2"></i><strong>Required:</strong> Name and Content</div>'),
+            'name',
+            'content',
+            StaticHTML('<hr class="my-3">'),
+            StaticHTML('<h6 class="text-muted">Optional Fields</h6>'),
+            Row(
+                Column('application', css_class='col-md-6'),
+                Column('type', css_class='col-md-6'),
             ),
-            FormActions(
-                Submit('submit', 'Save Artifact', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:artifact_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
+            Row(
+                Column('status', css_class='col-md-6'),
+                Column(Field('increment_version', css_class='form-check-input'), css_class='col-md-6'),
+            ),
+            'file_upload',
+            StaticHTML('<small class="text-muted">Supported formats: PDF, DOC, DOCX, TXT, PY, JS, HTML, CSS, MD (Max 10MB)</small>'),
+            'description',
+        ),
+        _ARTIFACT_ACTIONS,
+    )
 
     def clean_file_upload(self):
         """Validate file upload."""
         file = self.cleaned_data.get('file_upload')
         if file:
             # Check file size (10MB limit)
-            if file.size > 10 * 1024 * 1024:
+            if file.size > MAX_UPLOAD_SIZE:
                 raise ValidationError("File size cannot exceed 10MB.")
             
             # Check file extension
-            allowed_extensions = [
-                'pdf', 'doc', 'docx', 'txt', 'py', 'js', 
-                'html', 'css', 'md', 'json', 'xml'
-            ]
-            file_extension = file.name.split('.')[-1].lower()
-            if file_extension not in allowed_extensions:
+            file_extension = os.path.splitext(file.name)[1][1:].lower()
+            if file_extension not in ALLOWED_UPLOAD_EXTENSIONS:
                 raise ValidationError(
                     f"File type '{file_extension}' not allowed. "
-                    f"Allowed types: {', '.join(allowed_extensions)}"
+                    f"Allowed types: {ALLOWED_UPLOAD_EXTENSIONS_DISPLAY}"
                 )
         return file
 
@@ -262,13 +375,11 @@ class ArtifactForm(forms.ModelForm):
         
         # Handle version increment
         if self.cleaned_data.get('increment_version') and instance.pk:
-            # Parse current version and increment
-            current_version = instance.version
-            try:
-                major, minor = map(int, current_version.split('.'))
-                minor += 1
-                instance.version = f"{major}.{minor}"
-            except (ValueError, AttributeError):
+            # Bump the minor part of a "major.minor" version
+            match = VERSION_RE.fullmatch(instance.version or '')
+            if match:
+                instance.version = f"{int(match['major'])}.{int(match['minor']) + 1}"
+            else:
                 # If version format is invalid, set to 1.1
                 instance.version = "1.1"
         elif not instance.version:
@@ -283,6 +394,8 @@ class ArtifactForm(forms.ModelForm):
 class TaskForm(forms.ModelForm):
     """Form for creating and updating tasks with time tracking."""
 
+    application = _application_choice_field()
+
     class Meta:
         model = Task
         fields = [
@@ -291,13 +404,12 @@ class TaskForm(forms.ModelForm):
             'estimated_hours', 'actual_hours'
         ]
         widgets = {
-            'application': forms.Select(attrs={'class': 'form-select'}),
-            'title': forms.TextInput(attrs={'class': 'form-control'}),
+            'title': _TEXT_INPUT,
             'description': forms.Textarea(attrs={'rows': 4, 'class': 'form-control'}),
-            'assignee': forms.Select(attrs={'class': 'form-select'}),
-            'status': forms.Select(attrs={'class': 'form-select'}),
-            'priority': forms.Select(attrs={'class': 'form-select'}),
-            'due_date': forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}),
+            'assignee': _SELECT,
+            'status': _SELECT,
+            'priority': _SELECT,
+            'due_date': _DATE_INPUT,
             'estimated_hours': forms.NumberInput(attrs={
                 'class': 'form-control', 
                 'min': 1, 
@@ -312,38 +424,30 @@ class TaskForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Fieldset(
-                'Task Information',
-                Row(
-                    Column('application', css_class='col-md-6'),
-                    Column('title', css_class='col-md-6'),
-                ),
-                'description',
-                Row(
-                    Column('assignee', css_class='col-md-6'),
-                    Column('status', css_class='col-md-6'),
-                ),
-                Row(
-                    Column('priority', css_class='col-md-4'),
-                    Column('due_date', css_class='col-md-4'),
-                    Column(Field('estimated_hours'), css_class='col-md-4'),
-                ),
-                'actual_hours',
-                HTML('<small class="text-muted">Assignee options: Claude (AI assistance), GitHub Copilot (Code generation), Human (Manual tasks), Team (Collaborative work)</small>'),
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Fieldset(
+            'Task Information',
+            Row(
+                Column('application', css_class='col-md-6'),
+                Column('title', css_class='col-md-6'),
             ),
-            FormActions(
-                Submit('submit', 'Save Task', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:task_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
-
-        # Make assignee_user conditional based on assignee_type
-        # Remove conditional logic since we're using a simple choice field now
+            'description',
+            Row(
+                Column('assignee', css_class='col-md-6'),
+                Column('status', css_class='col-md-6'),
+            ),
+            Row(
+                Column('priority', css_class='col-md-4'),
+                Column('due_date', css_class='col-md-4'),
+                Column(Field('estimated_hours'), css_class='col-md-4'),
+            ),
+            'actual_hours',
+            StaticHTML('<small class="text-muted">Assignee options: Claude (AI assistance), GitHub Copilot (Code generation), Human (Manual tasks), Team (Collaborative work)</small>'),
+        ),
+        _TASK_ACTIONS,
+    )
 
     def clean(self):
         """Custom validation for task form."""
@@ -395,31 +499,27 @@ class SearchForm(forms.Form):
         choices=SEARCH_TYPE_CHOICES,
         initial='all',
         required=False,
-        widget=forms.Select(attrs={'class': 'form-select'})
+        widget=_SELECT
     )
     
-    project = forms.ModelChoiceField(
-        queryset=Project.objects.all(),
-        required=False,
-        empty_label="All Projects",
-        widget=forms.Select(attrs={'class': 'form-select'})
-    )
+    project = _project_choice_field(required=False, empty_label="All Projects")
+
+    def render(self, template_name=None, context=None, renderer=None):
+        """Fill the prebuilt search markup with the field widgets; only the widgets vary per request."""
+        if template_name is not None:
+            return super().render(template_name, context, renderer)
+        return format_html(
+            SEARCH_FORM_SHELL,
+            *(self._render_column(name) for name in ('query', 'search_type', 'project')),
+            reverse('tracker:search'),
+        )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'get'
-        self.helper.form_class = 'form-inline'
-        self.helper.layout = Layout(
-            Row(
-                Column('query', css_class='col-md-6'),
-                Column('search_type', css_class='col-md-3'),
-                Column('project', css_class='col-md-3'),
-            ),
-            FormActions(
-                Submit('submit', 'Search', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:search" %}" class="btn btn-outline-secondary ms-2">Clear</a>'),
-            )
+    __str__ = __html__ = render
+
+    def _render_column(self, name):
+        bound_field = self[name]
+        return format_html(
+            '{}{}{}', bound_field.label_tag(attrs={'class': 'form-label'}, label_suffix=''), bound_field, bound_field.errors,
         )
 
 
@@ -435,22 +535,28 @@ class BulkTaskForm(forms.Form):
         ('update_due_date', 'Update Due Date'),
     ]
 
+    # Actions that need an extra field, with the error shown when it is missing
+    ACTION_REQUIRED_FIELDS = {
+        'change_assignee': ('new_assignee', 'New assignee is required for this action.'),
+        'update_due_date': ('new_due_date', 'New due date is required for this action.'),
+    }
+
     action = forms.ChoiceField(
         choices=BULK_ACTIONS,
         required=True,
-        widget=forms.Select(attrs={'class': 'form-select'})
+        widget=_SELECT
     )
     
     # Optional fields for specific actions
     new_assignee = forms.ChoiceField(
         choices=Task.ASSIGNEE_CHOICES,
         required=False,
-        widget=forms.Select(attrs={'class': 'form-select'})
+        widget=_SELECT
     )
     
     new_due_date = forms.DateField(
         required=False,
-        widget=forms.DateInput(attrs={'type': 'date', 'class': 'form-control'})
+        widget=_DATE_INPUT
     )
     
     selected_tasks = forms.CharField(
@@ -458,58 +564,47 @@ class BulkTaskForm(forms.Form):
         required=True
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Row(
-                Column('action', css_class='col-md-4'),
-                Column('new_assignee', css_class='col-md-4'),
-                Column('new_due_date', css_class='col-md-4'),
-            ),
-            'selected_tasks',
-            FormActions(
-                Submit('submit', 'Apply Action', css_class='btn btn-warning'),
-            )
-        )
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Row(
+            Column('action', css_class='col-md-4'),
+            Column('new_assignee', css_class='col-md-4'),
+            Column('new_due_date', css_class='col-md-4'),
+        ),
+        'selected_tasks',
+        _BULK_TASK_ACTIONS,
+    )
 
     def clean(self):
         """Validate bulk action requirements."""
         cleaned_data = super().clean()
         action = cleaned_data.get('action')
         
-        if action == 'change_assignee':
-            if not cleaned_data.get('new_assignee'):
-                raise ValidationError({
-                    'new_assignee': 'New assignee is required for this action.'
-                })
-        
-        elif action == 'update_due_date':
-            if not cleaned_data.get('new_due_date'):
-                raise ValidationError({
-                    'new_due_date': 'New due date is required for this action.'
-                })
-        
+        field, message = self.ACTION_REQUIRED_FIELDS.get(action, (None, None))
+        if field and not cleaned_data.get(field):
+            raise ValidationError({field: message})
+
         # Validate selected tasks
         selected_tasks = cleaned_data.get('selected_tasks', '')
         if not selected_tasks:
             raise ValidationError('No tasks selected for bulk operation.')
         
-        try:
-            task_ids = [int(id) for id in selected_tasks.split(',') if id.strip()]
-            if not task_ids:
-                raise ValidationError('No valid task IDs found.')
-            cleaned_data['task_ids'] = task_ids
-        except ValueError:
+        if not TASK_IDS_RE.fullmatch(selected_tasks):
             raise ValidationError('Invalid task IDs format.')
-        
+        task_ids = [int(task_id) for task_id in TASK_ID_RE.findall(selected_tasks)]
+        if not task_ids:
+            raise ValidationError('No valid task IDs found.')
+        cleaned_data['task_ids'] = task_ids
+
         return cleaned_data
 
 
 class DecisionForm(forms.ModelForm):
     """Form for creating and updating decisions."""
 
+    project = _project_choice_field()
+
     class Meta:
         model = Decision
         fields = [
@@ -517,44 +612,41 @@ class DecisionForm(forms.ModelForm):
             'impact', 'decision_maker', 'decided_date'
         ]
         widgets = {
-            'project': forms.Select(attrs={'class': 'form-select'}),
-            'title': forms.TextInput(attrs={'class': 'form-control'}),
+            'title': _TEXT_INPUT,
             'description': forms.Textarea(attrs={'rows': 4, 'class': 'form-control'}),
-            'status': forms.Select(attrs={'class': 'form-select'}),
-            'impact': forms.Select(attrs={'class': 'form-select'}),
-            'decision_maker': forms.TextInput(attrs={'class': 'form-control'}),
-            'decided_date': forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}),
+            'status': _SELECT,
+            'impact': _SELECT,
+            'decision_maker': _TEXT_INPUT,
+            'decided_date': _DATE_INPUT,
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Fieldset(
-                'Decision Information',
-                Row(
-                    Column('project', css_class='col-md-6'),
-                    Column('title', css_class='col-md-6'),
-                ),
-                'description',
-                Row(
-                    Column('status', css_class='col-md-4'),
-                    Column('impact', css_class='col-md-4'),
-                    Column('decided_date', css_class='col-md-4'),
-                ),
-                'decision_maker',
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Fieldset(
+            'Decision Information',
+            Row(
+                Column('project', css_class='col-md-6'),
+                Column('title', css_class='col-md-6'),
             ),
-            FormActions(
-                Submit('submit', 'Save Decision', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:decision_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
+            'description',
+            Row(
+                Column('status', css_class='col-md-4'),
+                Column('impact', css_class='col-md-4'),
+                Column('decided_date', css_class='col-md-4'),
+            ),
+            'decision_maker',
+        ),
+        _DECISION_ACTIONS,
+    )
 
 
 class IntegrationForm(forms.ModelForm):
     """Form for creating and updating integrations."""
 
+    from_app = _application_choice_field()
+    to_app = _application_choice_field()
+
     class Meta:
         model = Integration
         fields = [
@@ -562,11 +654,9 @@ class IntegrationForm(forms.ModelForm):
             'complexity', 'description', 'estimated_weeks'
         ]
         widgets = {
-            'from_app': forms.Select(attrs={'class': 'form-select'}),
-            'to_app': forms.Select(attrs={'class': 'form-select'}),
-            'integration_type': forms.Select(attrs={'class': 'form-select'}),
-            'status': forms.Select(attrs={'class': 'form-select'}),
-            'complexity': forms.Select(attrs={'class': 'form-select'}),
+            'integration_type': _SELECT,
+            'status': _SELECT,
+            'complexity': _SELECT,
             'description': forms.Textarea(attrs={'rows': 4, 'class': 'form-control'}),
             'estimated_weeks': forms.NumberInput(attrs={
                 'class': 'form-control', 
@@ -575,30 +665,25 @@ class IntegrationForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Fieldset(
-                'Integration Information',
-                Row(
-                    Column('from_app', css_class='col-md-6'),
-                    Column('to_app', css_class='col-md-6'),
-                ),
-                'description',
-                Row(
-                    Column('integration_type', css_class='col-md-4'),
-                    Column('status', css_class='col-md-4'),
-                    Column('complexity', css_class='col-md-4'),
-                ),
-                'estimated_weeks',
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Fieldset(
+            'Integration Information',
+            Row(
+                Column('from_app', css_class='col-md-6'),
+                Column('to_app', css_class='col-md-6'),
             ),
-            FormActions(
-                Submit('submit', 'Save Integration', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:integration_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
+            'description',
+            Row(
+                Column('integration_type', css_class='col-md-4'),
+                Column('status', css_class='col-md-4'),
+                Column('complexity', css_class='col-md-4'),
+            ),
+            'estimated_weeks',
+        ),
+        _INTEGRATION_ACTIONS,
+    )
 
     def clean(self):
         """Validate integration form."""
@@ -636,19 +721,14 @@ class RequirementForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Fieldset(
-                'Requirement Information',
-                HTML('<div class="alert alert-info"><i class="bi bi-info-circle me-2"></i><strong>Claude Artifact Style:</strong> Content will be formatted with Markdown for professional display</div>'),
-                'name',
-                'content',
-            ),
-            FormActions(
-                Submit('submit', 'Save Requirement', css_class='btn btn-primary'),
-                HTML('<a href="{% url "tracker:requirement_list" %}" class="btn btn-secondary ms-2">Cancel</a>'),
-            )
-        )
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Fieldset(
+            'Requirement Information',
+            StaticHTML('<div class="alert alert-info"><i class="bi bi-info-circle me-2"></i><strong>Claude Artifact Style:</strong> Content will be formatted with Markdown for professional display</div>'),
+            'name',
+            'content',
+        ),
+        _REQUIREMENT_ACTIONS,
+    )
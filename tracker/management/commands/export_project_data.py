@@ -7,19 +7,194 @@ Supports JSON, CSV, and Excel export formats.
 Usage:
     python manage.py export_project_data --format json
     python manage.py export_project_data --format csv --project 1
+    python manage.py export_project_data --format csv --compress
     python manage.py export_project_data --format excel --output /path/to/export.xlsx
 """
 from django.core.management.base import BaseCommand, CommandError
 from django.core.serializers import serialize
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
 from django.http import HttpResponse
 from django.utils import timezone
 import json
 import csv
+import gzip
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import itertools
+from operator import itemgetter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from tracker.export_locks import ExportSlotUnavailable, export_slot
 from tracker.models import Project, Application, Artifact, Task, Decision, Integration
 
+# Model, related rows joined in for the exporters, and the lookup that scopes
+# each data type to a single project
+EXPORT_SOURCES = {
+    'projects': (Project, ('owner',), 'pk'),
+    'applications': (Application, ('project',), 'project'),
+    'tasks': (Task, ('application__project',), 'application__project'),
+    'artifacts': (Artifact, ('application__project',), 'application__project'),
+    'decisions': (Decision, ('project',), 'project'),
+    'integrations': (Integration, ('from_app__project', 'to_app'), 'from_app__project'),
+}
+
+# Rows fetched per database round trip when streaming an export
+EXPORT_CHUNK_SIZE = 2000
+
+# Rows fetched per database round trip when streaming CSV lines
+CSV_CHUNK_SIZE = 1000
+
+# Upper bound on the threads writing per-type CSV files at once
+EXPORT_MAX_WORKERS = 6
+
+# Output file buffer, so streamed rows reach the disk in large writes
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# (header, lookup) for every CSV column per data type
+CSV_COLUMNS = {
+    'projects': (
+        ('id', 'id'),
+        ('name', 'name'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('owner', 'owner__username'),
+        ('start_date', 'start_date'),
+        ('target_date', 'target_date'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    ),
+    'applications': (
+        ('id', 'id'),
+        ('name', 'name'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('project', 'project__name'),
+        ('complexity', 'complexity'),
+        ('estimated_weeks', 'estimated_weeks'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    ),
+    'tasks': (
+        ('id', 'id'),
+        ('title', 'title'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('priority', 'priority'),
+        ('project', 'application__project__name'),
+        ('application', 'application__name'),
+        ('due_date', 'due_date'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    ),
+}
+
+
+# Column titles for the Excel sheets, in CSV_COLUMNS order
+EXCEL_HEADERS = {
+    'projects': ('ID', 'Name', 'Description', 'Status', 'Owner', 'Start Date', 'Target Date', 'Created', 'Updated'),
+    'applications': ('ID', 'Name', 'Description', 'Status', 'Project', 'Complexity', 'Estimated Weeks', 'Created', 'Updated'),
+    'tasks': ('ID', 'Title', 'Description', 'Status', 'Priority', 'Project', 'Application', 'Due Date', 'Created', 'Updated'),
+}
+
+
+def _excel_value(value):
+    # Excel has no time zones, so aware datetimes are written in local time
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    return value
+
+
+def _dumps(value):
+    """UTF-8 JSON for value, serialized with orjson when it is installed."""
+    if orjson is None:
+        return json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(value)
+
+
+_COMMON_JSON_FIELDS = [
+    ('id', 'id'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+]
+
+# (JSON key, lookup) for every field exported per data type; dates and
+# datetimes are passed through and formatted by the serializer
+JSON_FIELD_SPECS = {
+    'projects': _COMMON_JSON_FIELDS + [
+        ('name', 'name'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('owner', 'owner__username'),
+        ('start_date', 'start_date'),
+        ('target_date', 'target_date'),
+    ],
+    'applications': _COMMON_JSON_FIELDS + [
+        ('name', 'name'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('project_id', 'project_id'),
+        ('project_name', 'project__name'),
+        ('complexity', 'complexity'),
+        ('estimated_weeks', 'estimated_weeks'),
+        ('features', 'features'),
+    ],
+    'tasks': _COMMON_JSON_FIELDS + [
+        ('title', 'title'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('project_id', 'application__project_id'),
+        ('project_name', 'application__project__name'),
+        ('application_id', 'application_id'),
+        ('application_name', 'application__name'),
+        ('priority', 'priority'),
+        ('due_date', 'due_date'),
+        ('assignee', 'assignee'),
+    ],
+    'artifacts': _COMMON_JSON_FIELDS + [
+        ('name', 'name'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('application_id', 'application_id'),
+        ('application_name', 'application__name'),
+        ('type', 'type'),
+        ('version', 'version'),
+        ('file_size_bytes', 'file_size_bytes'),
+    ],
+    'decisions': _COMMON_JSON_FIELDS + [
+        ('title', 'title'),
+        ('description', 'description'),
+        ('status', 'status'),
+        ('project_id', 'project_id'),
+        ('project_name', 'project__name'),
+        ('impact', 'impact'),
+        ('decided_date', 'decided_date'),
+        ('decision_maker', 'decision_maker'),
+    ],
+    'integrations': _COMMON_JSON_FIELDS + [
+        ('description', 'description'),
+        ('status', 'status'),
+        ('integration_type', 'integration_type'),
+        ('complexity', 'complexity'),
+        ('from_app_id', 'from_app_id'),
+        ('from_app_name', 'from_app__name'),
+        ('to_app_id', 'to_app_id'),
+        ('to_app_name', 'to_app__name'),
+        ('estimated_weeks', 'estimated_weeks'),
+    ],
+}
+
+# Lookups to fetch and the keys to store them under, per data type
+JSON_FIELDS = {
+    data_type: (tuple(lookup for _, lookup in specs), tuple(key for key, _ in specs))
+    for data_type, specs in JSON_FIELD_SPECS.items()
+}
+
 
 class Command(BaseCommand):
     help = 'Export project data to JSON, CSV, or Excel format'
@@ -50,8 +225,26 @@ class Command(BaseCommand):
             default=['projects', 'applications', 'tasks', 'artifacts', 'decisions', 'integrations'],
             help='Include specific data types (default: all)',
         )
+        parser.add_argument(
+            '--wait',
+            action='store_true',
+            help='Wait for a running export to finish instead of failing (see EXPORT_MAX_CONCURRENT)',
+        )
+        parser.add_argument(
+            '--compress',
+            action='store_true',
+            help='Gzip the CSV files (implied by an --output path ending in .gz)',
+        )
 
     def handle(self, *args, **options):
+        # Cap the number of exports running at once across processes
+        try:
+            with export_slot(wait=options['wait']):
+                self.export(options)
+        except ExportSlotUnavailable:
+            raise CommandError('Another export is already running; retry later or pass --wait')
+
+    def export(self, options):
         try:
             # Validate project ID if provided
             project = None
@@ -75,7 +268,7 @@ class Command(BaseCommand):
             if export_format == 'json':
                 self.export_json(output_path, project, include_types)
             elif export_format == 'csv':
-                self.export_csv(output_path, project, include_types)
+                self.export_csv(output_path, project, include_types, compress=options['compress'])
             elif export_format == 'excel':
                 self.export_excel(output_path, project, include_types)
 
@@ -101,309 +294,165 @@ class Command(BaseCommand):
         
         return os.path.join(exports_dir, filename)
 
-    def get_filtered_data(self, project, include_types):
-        """Get filtered data based on project and include types."""
-        data = {}
-
-        if 'projects' in include_types:
-            if project:
-                data['projects'] = [project]
-            else:
-                data['projects'] = list(Project.objects.all())
-
-        if 'applications' in include_types:
-            if project:
-                data['applications'] = list(project.application_set.all())
-            else:
-                data['applications'] = list(Application.objects.all())
-
-        if 'tasks' in include_types:
-            if project:
-                data['tasks'] = list(Task.objects.filter(project=project))
-            else:
-                data['tasks'] = list(Task.objects.all())
-
-        if 'artifacts' in include_types:
-            if project:
-                data['artifacts'] = list(Artifact.objects.filter(application__project=project))
-            else:
-                data['artifacts'] = list(Artifact.objects.all())
-
-        if 'decisions' in include_types:
-            if project:
-                data['decisions'] = list(project.decision_set.all())
-            else:
-                data['decisions'] = list(Decision.objects.all())
-
-        if 'integrations' in include_types:
-            if project:
-                data['integrations'] = list(Integration.objects.filter(
-                    from_application__project=project
-                ))
-            else:
-                data['integrations'] = list(Integration.objects.all())
+    def get_queryset(self, data_type, project):
+        """Queryset for one data type, joined to the related rows the exporters read."""
+        model, related, project_lookup = EXPORT_SOURCES[data_type]
+        queryset = model.objects.select_related(*related)
+        if project:
+            queryset = queryset.filter(**{project_lookup: project})
+        return queryset
 
-        return data
+    def get_data_types(self, include_types):
+        """Requested data types, in export order."""
+        return [data_type for data_type in EXPORT_SOURCES if data_type in include_types]
 
     def export_json(self, output_path, project, include_types):
-        """Export data to JSON format."""
+        """Export data to JSON format, writing one object at a time."""
         self.stdout.write('Exporting to JSON format...')
-        
-        data = self.get_filtered_data(project, include_types)
-        export_data = {
-            'export_info': {
-                'timestamp': timezone.now().isoformat(),
-                'format': 'json',
-                'project': project.name if project else 'all',
-                'include_types': include_types,
-            },
-            'data': {}
-        }
 
-        # Serialize each data type
-        for data_type, objects in data.items():
-            if objects:
-                # Convert Django model instances to serializable format
-                serialized_objects = []
-                for obj in objects:
-                    obj_data = {
-                        'id': obj.id,
-                        'created_at': obj.created_at.isoformat() if hasattr(obj, 'created_at') else None,
-                        'updated_at': obj.updated_at.isoformat() if hasattr(obj, 'updated_at') else None,
-                    }
-
-                    # Add model-specific fields
-                    if hasattr(obj, 'name'):
-                        obj_data['name'] = obj.name
-                    if hasattr(obj, 'title'):
-                        obj_data['title'] = obj.title
-                    if hasattr(obj, 'description'):
-                        obj_data['description'] = obj.description
-                    if hasattr(obj, 'status'):
-                        obj_data['status'] = obj.status
-
-                    # Add relationship fields
-                    if hasattr(obj, 'project'):
-                        obj_data['project_id'] = obj.project.id if obj.project else None
-                        obj_data['project_name'] = obj.project.name if obj.project else None
-                    if hasattr(obj, 'application'):
-                        obj_data['application_id'] = obj.application.id if obj.application else None
-                        obj_data['application_name'] = obj.application.name if obj.application else None
-
-                    # Add model-specific fields
-                    if data_type == 'projects':
-                        obj_data.update({
-                            'owner': obj.owner.username,
-                            'start_date': obj.start_date.isoformat() if obj.start_date else None,
-                            'target_date': obj.target_date.isoformat() if obj.target_date else None,
-                        })
-                    elif data_type == 'applications':
-                        obj_data.update({
-                            'features': obj.features,
-                            'tech_stack': obj.tech_stack,
-                            'version': obj.version,
-                            'repository_url': obj.repository_url,
-                        })
-                    elif data_type == 'tasks':
-                        obj_data.update({
-                            'priority': obj.priority,
-                            'due_date': obj.due_date.isoformat() if obj.due_date else None,
-                            'assigned_to': obj.assigned_to.username if hasattr(obj, 'assigned_to') and obj.assigned_to else None,
-                        })
-                    elif data_type == 'artifacts':
-                        obj_data.update({
-                            'artifact_type': obj.artifact_type,
-                            'version': obj.version,
-                            'file_size': obj.file_size if hasattr(obj, 'file_size') else None,
-                        })
-
-                    serialized_objects.append(obj_data)
-
-                export_data['data'][data_type] = serialized_objects
-
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-
-        self.stdout.write(f'Exported {sum(len(v) for v in export_data["data"].values())} records')
-
-    def export_csv(self, output_path, project, include_types):
+        export_info = {
+            'timestamp': timezone.now(),
+            'format': 'json',
+            'project': project.name if project else 'all',
+            'include_types': include_types,
+        }
+        total_records = 0
+
+        # Rows are streamed from the database and written as they are
+        # serialized, so memory use does not grow with the export size
+        with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(b'{\n  "export_info": ')
+            f.write(_dumps(export_info))
+            f.write(b',\n  "data": {')
+            for type_index, data_type in enumerate(self.get_data_types(include_types)):
+                self._write_sep(f, type_index == 0, indent=4)
+                f.write(b'"%s": [' % data_type.encode())
+                lookups, keys = JSON_FIELDS[data_type]
+                rows = self.get_queryset(data_type, project).values_list(*lookups)
+                count = 0
+                for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                    self._write_sep(f, count == 0, indent=6)
+                    f.write(_dumps(dict(zip(keys, row))))
+                    count += 1
+                f.write(b'\n    ]' if count else b']')
+                total_records += count
+            f.write(b'\n  }\n}\n')
+
+        self.stdout.write(f'Exported {total_records} records')
+
+    def _write_sep(self, f, first, indent):
+        """Start the next JSON member on its own line, comma-separated from the previous one."""
+        f.write((b'\n' if first else b',\n') + b' ' * indent)
+
+    def export_csv(self, output_path, project, include_types, compress=False):
         """Export data to CSV format (creates separate CSV for each data type)."""
         self.stdout.write('Exporting to CSV format...')
-        
-        data = self.get_filtered_data(project, include_types)
-        
+
+        if output_path.endswith('.gz'):
+            output_path = output_path[:-3]
+            compress = True
+
         # Create CSV files for each data type
         base_path = output_path.rsplit('.', 1)[0]
-        
-        for data_type, objects in data.items():
-            if not objects:
-                continue
-                
+        data_types = [data_type for data_type in self.get_data_types(include_types) if data_type in CSV_COLUMNS]
+
+        # Each type goes to its own file, so the files are written side by
+        # side. Worker threads query over their own connections, which cannot
+        # see rows from a transaction still open on this one.
+        if connection.in_atomic_block or len(data_types) < 2:
+            results = [self._write_csv_for(data_type, project, base_path, compress) for data_type in data_types]
+        else:
+            with ThreadPoolExecutor(max_workers=min(EXPORT_MAX_WORKERS, len(data_types))) as executor:
+                futures = [
+                    executor.submit(self._write_csv_in_thread, data_type, project, base_path, compress)
+                    for data_type in data_types
+                ]
+                results = [future.result() for future in futures]
+
+        for csv_path, count in results:
+            self.stdout.write(f'Created CSV: {csv_path} ({count} records)')
+
+    def _write_csv_in_thread(self, data_type, project, base_path, compress):
+        try:
+            return self._write_csv_for(data_type, project, base_path, compress)
+        finally:
+            connection.close()
+
+    def _write_csv_for(self, data_type, project, base_path, compress=False):
+        """Write the CSV file for one data type; returns its path and record count."""
+        if compress:
+            # Fastest level: most of the size saving for little CPU time
+            csv_path = f'{base_path}_{data_type}.csv.gz'
+            csvfile = gzip.open(csv_path, 'wt', newline='', encoding='utf-8', compresslevel=1)
+        else:
             csv_path = f'{base_path}_{data_type}.csv'
-            
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                if data_type == 'projects':
-                    fieldnames = ['id', 'name', 'description', 'status', 'owner', 'start_date', 'target_date', 'created_at', 'updated_at']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for obj in objects:
-                        writer.writerow({
-                            'id': obj.id,
-                            'name': obj.name,
-                            'description': obj.description,
-                            'status': obj.status,
-                            'owner': obj.owner.username,
-                            'start_date': obj.start_date,
-                            'target_date': obj.target_date,
-                            'created_at': obj.created_at,
-                            'updated_at': obj.updated_at,
-                        })
-
-                elif data_type == 'applications':
-                    fieldnames = ['id', 'name', 'description', 'status', 'project', 'version', 'repository_url', 'created_at', 'updated_at']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for obj in objects:
-                        writer.writerow({
-                            'id': obj.id,
-                            'name': obj.name,
-                            'description': obj.description,
-                            'status': obj.status,
-                            'project': obj.project.name,
-                            'version': obj.version,
-                            'repository_url': obj.repository_url,
-                            'created_at': obj.created_at,
-                            'updated_at': obj.updated_at,
-                        })
-
-                elif data_type == 'tasks':
-                    fieldnames = ['id', 'title', 'description', 'status', 'priority', 'project', 'application', 'due_date', 'created_at', 'updated_at']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for obj in objects:
-                        writer.writerow({
-                            'id': obj.id,
-                            'title': obj.title,
-                            'description': obj.description,
-                            'status': obj.status,
-                            'priority': obj.priority,
-                            'project': obj.project.name if obj.project else '',
-                            'application': obj.application.name if obj.application else '',
-                            'due_date': obj.due_date,
-                            'created_at': obj.created_at,
-                            'updated_at': obj.updated_at,
-                        })
-
-            self.stdout.write(f'Created CSV: {csv_path} ({len(objects)} records)')
+            csvfile = open(csv_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE)
+
+        header, lookups = zip(*CSV_COLUMNS[data_type])
+        rows = self.get_queryset(data_type, project).values_list(*lookups).iterator(chunk_size=CSV_CHUNK_SIZE)
+
+        # values_list rows are already in column order, so writerows takes them
+        # as they are; zip advances the counter once per row it passes through
+        counter = itertools.count()
+        with csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(header)
+            writer.writerows(map(itemgetter(0), zip(rows, counter)))
+        return csv_path, next(counter)
 
     def export_excel(self, output_path, project, include_types):
         """Export data to Excel format with multiple sheets."""
         try:
             import openpyxl
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill
-            from openpyxl.utils.dataframe import dataframe_to_rows
-            import pandas as pd
         except ImportError:
-            raise CommandError('openpyxl and pandas are required for Excel export. Install with: pip install openpyxl pandas')
+            raise CommandError('openpyxl is required for Excel export. Install with: pip install openpyxl')
 
         self.stdout.write('Exporting to Excel format...')
-        
-        data = self.get_filtered_data(project, include_types)
-        
-        # Create Excel workbook
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet if it exists
-        if wb.active:
-            wb.remove(wb.active)
-        
-        for data_type, objects in data.items():
-            if not objects:
+
+        # A write-only workbook streams rows to disk as they are appended
+        # instead of keeping every cell in memory until save
+        wb = openpyxl.Workbook(write_only=True)
+        header_font = Font(bold=True)
+        header_fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
+        counts = {}
+
+        def header_cell(ws, value):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = header_font
+            cell.fill = header_fill
+            return cell
+
+        for data_type in self.get_data_types(include_types):
+            if data_type not in EXCEL_HEADERS:
                 continue
-                
-            # Create worksheet for this data type
+
             ws = wb.create_sheet(title=data_type.capitalize())
-            
-            # Convert objects to DataFrame
-            if data_type == 'projects':
-                df_data = []
-                for obj in objects:
-                    df_data.append({
-                        'ID': obj.id,
-                        'Name': obj.name,
-                        'Description': obj.description,
-                        'Status': obj.status,
-                        'Owner': obj.owner.username,
-                        'Start Date': obj.start_date,
-                        'Target Date': obj.target_date,
-                        'Created': obj.created_at,
-                        'Updated': obj.updated_at,
-                    })
-            
-            elif data_type == 'applications':
-                df_data = []
-                for obj in objects:
-                    df_data.append({
-                        'ID': obj.id,
-                        'Name': obj.name,
-                        'Description': obj.description,
-                        'Status': obj.status,
-                        'Project': obj.project.name,
-                        'Version': obj.version,
-                        'Repository': obj.repository_url,
-                        'Created': obj.created_at,
-                        'Updated': obj.updated_at,
-                    })
-            
-            elif data_type == 'tasks':
-                df_data = []
-                for obj in objects:
-                    df_data.append({
-                        'ID': obj.id,
-                        'Title': obj.title,
-                        'Description': obj.description,
-                        'Status': obj.status,
-                        'Priority': obj.priority,
-                        'Project': obj.project.name if obj.project else '',
-                        'Application': obj.application.name if obj.application else '',
-                        'Due Date': obj.due_date,
-                        'Created': obj.created_at,
-                        'Updated': obj.updated_at,
-                    })
-            
-            # Create DataFrame and add to worksheet
-            if df_data:
-                df = pd.DataFrame(df_data)
-                
-                # Add DataFrame to worksheet
-                for r in dataframe_to_rows(df, index=False, header=True):
-                    ws.append(r)
-                
-                # Format headers
-                for cell in ws[1]:
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-        
+            ws.append([header_cell(ws, header) for header in EXCEL_HEADERS[data_type]])
+
+            _, lookups = zip(*CSV_COLUMNS[data_type])
+            rows = self.get_queryset(data_type, project).values_list(*lookups)
+            count = 0
+            for count, row in enumerate(rows.iterator(chunk_size=CSV_CHUNK_SIZE), 1):
+                ws.append([_excel_value(value) for value in row])
+            counts[data_type] = count
+
         # Add summary sheet
         summary_ws = wb.create_sheet(title='Summary', index=0)
-        summary_ws.append(['FamilyHub Development Tracker - Export Summary'])
+        title_cell = WriteOnlyCell(summary_ws, value='FamilyHub Development Tracker - Export Summary')
+        title_cell.font = Font(bold=True, size=14)
+        summary_ws.append([title_cell])
         summary_ws.append(['Export Date:', timezone.now().strftime('%Y-%m-%d %H:%M:%S')])
         summary_ws.append(['Project:', project.name if project else 'All Projects'])
         summary_ws.append([])
         summary_ws.append(['Data Type', 'Record Count'])
-        
-        for data_type, objects in data.items():
-            summary_ws.append([data_type.capitalize(), len(objects)])
-        
-        # Format summary sheet
-        summary_ws['A1'].font = Font(bold=True, size=14)
-        
+
+        for data_type, count in counts.items():
+            summary_ws.append([data_type.capitalize(), count])
+
         # Save workbook
         wb.save(output_path)
-        
-        total_records = sum(len(objects) for objects in data.values())
-        self.stdout.write(f'Created Excel file with {len(data)} sheets and {total_records} total records')
+
+        total_records = sum(counts.values())
+        self.stdout.write(f'Created Excel file with {len(counts)} sheets and {total_records} total records')
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0003_requirement'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artifact',
+            index=models.Index(fields=['type'], name='tracker_art_type_9ae3bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artifact',
+            index=models.Index(fields=['status'], name='tracker_art_status_97f802_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artifact',
+            index=models.Index(fields=['-updated_at'], name='tracker_art_updated_d90bce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='integration',
+            index=models.Index(fields=['status'], name='tracker_int_status_88935e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status'], name='tracker_pro_status_0d02a4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at'], name='tracker_pro_created_db983a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status'], name='tracker_tas_status_db09d4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['priority'], name='tracker_tas_priorit_6088ae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date'], name='tracker_tas_due_dat_d45f44_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['-created_at'], name='tracker_tas_created_a0e093_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Trigram GIN indexes for project and task search, built on the same
+# UPPER(col::text) expression as accounts/0003. PostgreSQL only.
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ('Project', 'tracker_project_name_trgm', 'name'),
+    ('Project', 'tracker_project_description_trgm', 'description'),
+    ('Task', 'tracker_task_title_trgm', 'title'),
+    ('Task', 'tracker_task_description_trgm', 'description'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for model_name, name, column in TRIGRAM_INDEXES:
+        table = schema_editor.quote_name(apps.get_model('tracker', model_name)._meta.db_table)
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} '
+            f'ON {table} USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0004_add_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
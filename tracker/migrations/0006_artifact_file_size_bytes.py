@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:06
+
+from django.db import migrations, models
+
+
+def backfill_file_size_bytes(apps, schema_editor):
+    Artifact = apps.get_model('tracker', 'Artifact')
+    for artifact in Artifact.objects.exclude(file_upload='').only('pk', 'file_upload').iterator():
+        try:
+            size = artifact.file_upload.size
+        except (OSError, ValueError):
+            continue
+        Artifact.objects.filter(pk=artifact.pk).update(file_size_bytes=size)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0005_add_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artifact',
+            name='file_size_bytes',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_file_size_bytes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0006_artifact_file_size_bytes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artifact',
+            index=models.Index(condition=models.Q(('application__isnull', True)), fields=['-updated_at'], name='artifact_standalone_idx'),
+        ),
+    ]
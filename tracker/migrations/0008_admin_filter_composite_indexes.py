@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0007_artifact_standalone_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tracker_tas_status_db09d4_idx',
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['status', 'complexity'], name='tracker_app_status_4f6196_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='decision',
+            index=models.Index(fields=['status', 'impact'], name='tracker_dec_status_be71b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='decision',
+            index=models.Index(fields=['-created_at'], name='tracker_dec_created_d404cb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='integration',
+            index=models.Index(fields=['integration_type', 'complexity'], name='tracker_int_integra_7b04f4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='integration',
+            index=models.Index(fields=['-created_at'], name='tracker_int_created_a7c38b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'priority'], name='tracker_tas_status_121945_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Trigram GIN indexes for application search, matching 0005 so the
+# icontains lookups in api_search are index-backed. PostgreSQL only.
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ('Application', 'tracker_application_name_trgm', 'name'),
+    ('Application', 'tracker_application_description_trgm', 'description'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for model_name, name, column in TRIGRAM_INDEXES:
+        table = schema_editor.quote_name(apps.get_model('tracker', model_name)._meta.db_table)
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} '
+            f'ON {table} USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0008_admin_filter_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0009_application_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['-updated_at'], name='tracker_tas_updated_deaf09_idx'),
+        ),
+    ]
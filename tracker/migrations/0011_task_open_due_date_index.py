@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0010_task_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'in-progress'])), fields=['due_date'], name='task_open_due_date_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:30
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_completion_percentage(apps, schema_editor):
+    Project = apps.get_model('tracker', 'Project')
+    projects = list(Project.objects.only('pk').annotate(
+        total_tasks=Count('applications__tasks'),
+        completed_tasks=Count('applications__tasks', filter=Q(applications__tasks__status='completed')),
+    ))
+    for project in projects:
+        project.completion_percentage = (
+            round((project.completed_tasks / project.total_tasks) * 100, 1) if project.total_tasks else 0
+        )
+    Project.objects.bulk_update(projects, ['completion_percentage'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0011_task_open_due_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='completion_percentage',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_completion_percentage, migrations.RunPython.noop),
+    ]
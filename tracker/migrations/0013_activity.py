@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:34
+
+from django.db import migrations, models
+
+
+def backfill_activity(apps, schema_editor):
+    Activity = apps.get_model('tracker', 'Activity')
+    sources = [
+        ('task', apps.get_model('tracker', 'Task').objects.select_related('application'), 'title'),
+        ('artifact', apps.get_model('tracker', 'Artifact').objects.select_related('application'), 'name'),
+        ('decision', apps.get_model('tracker', 'Decision').objects.select_related('project'), 'title'),
+    ]
+    for target_type, queryset, title_field in sources:
+        rows = []
+        for obj in queryset.iterator(chunk_size=1000):
+            if target_type == 'decision':
+                context = obj.project.name
+            else:
+                context = obj.application.name if obj.application_id else ''
+            rows.append(Activity(
+                target_type=target_type,
+                target_id=obj.pk,
+                title=getattr(obj, title_field),
+                description=f'in {context}' if context else '',
+                status=obj.status,
+                timestamp=obj.updated_at,
+            ))
+        Activity.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0012_project_completion_percentage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.CharField(choices=[('task', 'Task'), ('artifact', 'Artifact'), ('decision', 'Decision')], max_length=20)),
+                ('target_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.CharField(blank=True, max_length=200)),
+                ('status', models.CharField(blank=True, max_length=20)),
+                ('timestamp', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Activity',
+                'verbose_name_plural': 'Activities',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['-timestamp'], name='tracker_act_timesta_126baf_idx')],
+                'constraints': [models.UniqueConstraint(fields=('target_type', 'target_id'), name='activity_unique_target')],
+            },
+        ),
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,53 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Cast, Coalesce, NullIf, Round
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.core.validators import FileExtensionValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 import os
 
 User = get_user_model()
 
 
+def aggregate_task_counts(tasks):
+    """Aggregate total, completed and overdue counts over a Task queryset."""
+    return tasks.aggregate(
+        total=Count('pk'),
+        completed=Count('pk', filter=Q(status='completed')),
+        overdue=Count('pk', filter=Q(
+            due_date__lt=timezone.now().date(),
+            status__in=['pending', 'in-progress'],
+        )),
+    )
+
+
+def _project_task_count(**filters):
+    """Correlated subquery counting a project's tasks, 0 when it has none."""
+    tasks = Task.objects.filter(application__project=OuterRef('pk'), **filters).order_by()
+    return Coalesce(Subquery(
+        tasks.values('application__project').annotate(count=Count('pk')).values('count')
+    ), 0)
+
+
+def refresh_completion_percentages(projects):
+    """
+    Recompute the stored completion_percentage of the given projects.
+
+    Runs as a single UPDATE with correlated count subqueries, so every
+    project gets its own value without fetching rows or batching CASE
+    statements through bulk_update().
+    """
+    completed = Cast(_project_task_count(status='completed'), models.FloatField())
+    percentage = completed * 100 / NullIf(_project_task_count(), 0)
+    # Rounded as numeric: PostgreSQL has no ROUND(double precision, int)
+    percentage = Cast(percentage, models.DecimalField(max_digits=20, decimal_places=4))
+    Project.objects.filter(pk__in=projects.values('pk')).update(
+        completion_percentage=Coalesce(Round(percentage, 1), 0, output_field=models.FloatField())
+    )
+
+
 def artifact_upload_path(instance, filename):
     """Generate upload path for artifacts."""
     return f'artifacts/{instance.application.project.name}/{instance.application.name}/{filename}'
@@ -31,11 +71,18 @@ class Project(models.Model):
     start_date = models.DateField()
     target_date = models.DateField()
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='owned_projects')
+    # Share of completed tasks across all applications, kept current by the
+    # Task signals and by refresh_completion_percentages() after bulk updates
+    completion_percentage = models.FloatField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status']),
+            models.Index(fields=['-created_at']),
+        ]
         verbose_name = "Project"
         verbose_name_plural = "Projects"
 
@@ -45,34 +92,15 @@ class Project(models.Model):
     def get_absolute_url(self):
         return reverse('tracker:project_detail', kwargs={'pk': self.pk})
 
-    @property
-    def completion_percentage(self):
-        """Calculate project completion based on tasks across all applications."""
-        total_tasks = 0
-        completed_tasks = 0
-        
-        for app in self.applications.all():
-            app_tasks = app.tasks.all()
-            total_tasks += app_tasks.count()
-            completed_tasks += app_tasks.filter(status='completed').count()
-        
-        if total_tasks == 0:
-            return 0
-        return round((completed_tasks / total_tasks) * 100, 1)
+    @cached_property
+    def task_counts(self):
+        """Total, completed and overdue task counts across all applications, in one query."""
+        return aggregate_task_counts(Task.objects.filter(application__project=self))
 
     @property
     def overdue_tasks_count(self):
         """Count overdue tasks across all applications in the project."""
-        overdue_count = 0
-        today = timezone.now().date()
-        
-        for app in self.applications.all():
-            overdue_count += app.tasks.filter(
-                due_date__lt=today,
-                status__in=['pending', 'in-progress']
-            ).count()
-        
-        return overdue_count
+        return self.task_counts['overdue']
 
     @property
     def total_applications_count(self):
@@ -137,6 +165,9 @@ class Application(models.Model):
 
     class Meta:
         ordering = ['project', 'name']
+        indexes = [
+            models.Index(fields=['status', 'complexity']),
+        ]
         unique_together = ['project', 'name']
         verbose_name = "Application"
         verbose_name_plural = "Applications"
@@ -147,23 +178,23 @@ class Application(models.Model):
     def get_absolute_url(self):
         return reverse('tracker:application_detail', kwargs={'pk': self.pk})
 
+    @cached_property
+    def task_counts(self):
+        """Total, completed and overdue task counts for this application, in one query."""
+        return aggregate_task_counts(self.tasks.all())
+
     @property
     def tasks_completion_percentage(self):
         """Calculate application completion based on its tasks."""
-        total_tasks = self.tasks.count()
-        if total_tasks == 0:
+        counts = self.task_counts
+        if counts['total'] == 0:
             return 0
-        completed_tasks = self.tasks.filter(status='completed').count()
-        return round((completed_tasks / total_tasks) * 100, 1)
+        return round((counts['completed'] / counts['total']) * 100, 1)
 
     @property
     def overdue_tasks_count(self):
         """Count overdue tasks for this application."""
-        today = timezone.now().date()
-        return self.tasks.filter(
-            due_date__lt=today,
-            status__in=['pending', 'in-progress']
-        ).count()
+        return self.task_counts['overdue']
 
     @property
     def days_to_target(self):
@@ -204,6 +235,7 @@ class Artifact(models.Model):
         validators=[FileExtensionValidator(allowed_extensions=['pdf', 'doc', 'docx', 'txt', 'md', 'py', 'js', 'html', 'css'])]
     )
     content = models.TextField(help_text="Text content for the artifact")
+    file_size_bytes = models.PositiveBigIntegerField(default=0, editable=False)
     version = models.CharField(max_length=10, default='1.0', blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft', blank=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_artifacts', null=True, blank=True)
@@ -212,6 +244,16 @@ class Artifact(models.Model):
 
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['type']),
+            models.Index(fields=['status']),
+            models.Index(fields=['-updated_at']),
+            models.Index(
+                fields=['-updated_at'],
+                name='artifact_standalone_idx',
+                condition=models.Q(application__isnull=True),
+            ),
+        ]
         verbose_name = "Artifact"
         verbose_name_plural = "Artifacts"
 
@@ -223,12 +265,21 @@ class Artifact(models.Model):
     def get_absolute_url(self):
         return reverse('tracker:artifact_detail', kwargs={'pk': self.pk})
 
+    def save(self, *args, **kwargs):
+        """Record the uploaded file's size so listings don't stat storage per row."""
+        if self.file_upload:
+            try:
+                self.file_size_bytes = self.file_upload.size
+            except (OSError, ValueError):
+                pass
+        else:
+            self.file_size_bytes = 0
+        super().save(*args, **kwargs)
+
     @property
     def file_size_mb(self):
         """Get file size in MB if file exists."""
-        if self.file_upload:
-            return round(self.file_upload.size / (1024 * 1024), 2)
-        return 0
+        return round(self.file_size_bytes / (1024 * 1024), 2)
 
 
 class Task(models.Model):
@@ -270,6 +321,18 @@ class Task(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'priority']),
+            models.Index(fields=['priority']),
+            models.Index(fields=['due_date']),
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['-updated_at']),
+            models.Index(
+                fields=['due_date'],
+                name='task_open_due_date_idx',
+                condition=models.Q(status__in=['pending', 'in-progress']),
+            ),
+        ]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
 
@@ -332,6 +395,10 @@ class Decision(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'impact']),
+            models.Index(fields=['-created_at']),
+        ]
         verbose_name = "Decision"
         verbose_name_plural = "Decisions"
 
@@ -397,6 +464,11 @@ class Integration(models.Model):
     class Meta:
         ordering = ['-created_at']
         unique_together = ['from_app', 'to_app', 'integration_type']
+        indexes = [
+            models.Index(fields=['status']),
+            models.Index(fields=['integration_type', 'complexity']),
+            models.Index(fields=['-created_at']),
+        ]
         verbose_name = "Integration"
         verbose_name_plural = "Integrations"
 
@@ -457,3 +529,79 @@ class Requirement(models.Model):
 
     def get_absolute_url(self):
         return reverse('tracker:requirement_detail', kwargs={'pk': self.pk})
+
+
+def activity_description(context):
+    """Feed row description naming the application or project an object belongs to."""
+    return f'in {context}' if context else ''
+
+
+class Activity(models.Model):
+    """
+    Latest change to each task, artifact and decision, denormalized into one
+    table so the recent-activity feed is a single indexed scan.
+    """
+    TARGET_TYPE_CHOICES = [
+        ('task', 'Task'),
+        ('artifact', 'Artifact'),
+        ('decision', 'Decision'),
+    ]
+
+    target_type = models.CharField(max_length=20, choices=TARGET_TYPE_CHOICES)
+    target_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=200)
+    description = models.CharField(max_length=200, blank=True)
+    status = models.CharField(max_length=20, blank=True)
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['-timestamp']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['target_type', 'target_id'], name='activity_unique_target'),
+        ]
+        verbose_name = "Activity"
+        verbose_name_plural = "Activities"
+
+    def __str__(self):
+        return f"{self.get_target_type_display()}: {self.title}"
+
+    @classmethod
+    def for_object(cls, obj):
+        """Build the (unsaved) feed row for a task, artifact or decision."""
+        if isinstance(obj, Decision):
+            context = obj.project.name
+        else:
+            context = obj.application.name if obj.application_id else ''
+        return cls(
+            target_type=obj._meta.model_name,
+            target_id=obj.pk,
+            title=getattr(obj, 'title', None) or obj.name,
+            description=activity_description(context),
+            status=obj.status,
+            timestamp=obj.updated_at,
+        )
+
+
+def record_activity(objects):
+    """
+    Upsert the feed rows of the given tasks, artifacts or decisions in one
+    statement. Pass a queryset with the application (or project) joined.
+    """
+    Activity.objects.bulk_create(
+        [Activity.for_object(obj) for obj in objects],
+        update_conflicts=True,
+        unique_fields=['target_type', 'target_id'],
+        update_fields=['title', 'description', 'status', 'timestamp'],
+    )
+
+
+def tasks_changed(tasks):
+    """
+    Bring the rows derived from tasks up to date after a queryset.update()
+    bypassed the model signals: project completion and the activity feed.
+    """
+    refresh_completion_percentages(Project.objects.filter(applications__tasks__in=tasks))
+    record_activity(tasks.select_related('application'))
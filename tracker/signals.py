@@ -0,0 +1,120 @@
+"""
+FamilyHub Development Tracker - Signals
+
+Invalidates cached API aggregates and form choices, and refreshes the
+denormalized project completion and activity feed when the rows behind
+them change.
+"""
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .form_caches import CHOICE_CACHE_KEYS_BY_MODEL
+from .models import (
+    Activity, Application, Artifact, Decision, Project, Task,
+    activity_description, record_activity, refresh_completion_percentages,
+)
+
+PROJECT_STATUS_DISTRIBUTION_CACHE_KEY = 'tracker:api:project_status_distribution'
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project_status_distribution(sender, **kwargs):
+    """Drop the cached status distribution whenever a project changes."""
+    cache.delete(PROJECT_STATUS_DISTRIBUTION_CACHE_KEY)
+
+
+def invalidate_choice_caches(sender, update_fields=None, **kwargs):
+    """Drop the cached select options built from the changed model."""
+    # Logging in only touches last_login, which no option label shows
+    if update_fields != {'last_login'}:
+        cache.delete_many(CHOICE_CACHE_KEYS_BY_MODEL[sender._meta.label])
+
+
+for model_label in CHOICE_CACHE_KEYS_BY_MODEL:
+    post_save.connect(invalidate_choice_caches, sender=model_label)
+    post_delete.connect(invalidate_choice_caches, sender=model_label)
+
+
+@receiver(pre_save, sender=Task)
+def remember_previous_application(sender, instance, **kwargs):
+    """Note the task's stored application, so moving it also refreshes the project it left."""
+    instance._previous_application_id = None if instance._state.adding else (
+        Task.objects.filter(pk=instance.pk).values_list('application_id', flat=True).first()
+    )
+
+
+@receiver(pre_save, sender=Application)
+def remember_previous_project(sender, instance, **kwargs):
+    """Note the application's stored project and name, so a move or rename updates what copies them."""
+    previous = None if instance._state.adding else (
+        Application.objects.filter(pk=instance.pk).values_list('project_id', 'name').first()
+    )
+    instance._previous_project_id, instance._previous_name = previous or (None, None)
+
+
+@receiver(pre_save, sender=Project)
+def remember_previous_project_name(sender, instance, **kwargs):
+    """Note the project's stored name, so a rename updates the activity rows that copy it."""
+    instance._previous_name = None if instance._state.adding else (
+        Project.objects.filter(pk=instance.pk).values_list('name', flat=True).first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Task)
+def refresh_project_completion(sender, instance, **kwargs):
+    """Keep the owning project's stored completion_percentage in step with its tasks."""
+    application_ids = {instance.application_id, getattr(instance, '_previous_application_id', None)}
+    refresh_completion_percentages(Project.objects.filter(applications__id__in=application_ids))
+
+
+@receiver(post_save, sender=Application)
+def refresh_moved_application_completion(sender, instance, **kwargs):
+    """Refresh both projects when an application moves to another project."""
+    previous_project_id = getattr(instance, '_previous_project_id', None)
+    if previous_project_id is not None and previous_project_id != instance.project_id:
+        refresh_completion_percentages(Project.objects.filter(pk__in=[previous_project_id, instance.project_id]))
+
+
+@receiver(post_delete, sender=Application)
+def refresh_deleted_application_completion(sender, instance, **kwargs):
+    """Refresh the project once an application and its tasks are gone."""
+    refresh_completion_percentages(Project.objects.filter(pk=instance.project_id))
+
+
+@receiver(post_save, sender=Application)
+def rename_application_activity(sender, instance, created, **kwargs):
+    """Rewrite the 'in <application>' context of its tasks' and artifacts' feed rows after a rename."""
+    if created or getattr(instance, '_previous_name', instance.name) == instance.name:
+        return
+    Activity.objects.filter(
+        Q(target_type='task', target_id__in=instance.tasks.values('pk'))
+        | Q(target_type='artifact', target_id__in=instance.artifacts.values('pk'))
+    ).update(description=activity_description(instance.name))
+
+
+@receiver(post_save, sender=Project)
+def rename_project_activity(sender, instance, created, **kwargs):
+    """Rewrite the 'in <project>' context of its decisions' feed rows after a rename."""
+    if created or getattr(instance, '_previous_name', instance.name) == instance.name:
+        return
+    Activity.objects.filter(
+        target_type='decision', target_id__in=instance.decisions.values('pk'),
+    ).update(description=activity_description(instance.name))
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Artifact)
+@receiver(post_save, sender=Decision)
+def record_saved_activity(sender, instance, **kwargs):
+    """Move the saved object to the top of the activity feed."""
+    record_activity([instance])
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Artifact)
+@receiver(post_delete, sender=Decision)
+def remove_deleted_activity(sender, instance, **kwargs):
+    """Drop the deleted object's activity feed row."""
+    Activity.objects.filter(target_type=sender._meta.model_name, target_id=instance.pk).delete()
@@ -1,3 +1,902 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import api_views
+from .admin import TaskAdmin
+from .admin.badges import PROJECT_STATUS_BADGES, render_badge
+from .admin.changelist import EstimatedCountPaginator
+from .admin.inlines import LimitedInlineFormSet
+from .checks import check_cached_template_loader
+from .export_locks import export_slot
+from .forms import ApplicationForm, ArtifactForm, BulkTaskForm, ProjectForm, SearchForm, TaskForm
+from .models import Activity, Application, Artifact, Decision, Integration, Project, Task, tasks_changed
+
+User = get_user_model()
+
+
+class TrackerTestCase(TestCase):
+    """Shared fixtures for tracker tests."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='password',
+            first_name='Ada',
+            last_name='Lovelace',
+        )
+        cls.project = Project.objects.create(
+            name='FamilyHub',
+            description='Unified platform',
+            status='development',
+            start_date=date.today() - timedelta(days=30),
+            target_date=date.today() + timedelta(days=30),
+            owner=cls.user,
+        )
+        cls.application = Application.objects.create(
+            project=cls.project,
+            name='Timesheet',
+            description='Timesheet tracker',
+            estimated_weeks=4,
+        )
+        Task.objects.create(application=cls.application, title='Models', status='completed')
+        Task.objects.create(
+            application=cls.application,
+            title='Views',
+            status='pending',
+            due_date=date.today() - timedelta(days=1),
+        )
+
+
+class AdminChangelistTests(TrackerTestCase):
+    """Admin changelists render with annotated columns."""
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_project_changelist(self):
+        response = self.client.get(reverse('admin:tracker_project_changelist'))
+        self.assertEqual(response.status_code, 200)
+        project = response.context['cl'].result_list[0]
+        self.assertEqual(project._applications_count, 1)
+        self.assertEqual(project._completion, 50.0)
+        self.assertIn('description', project.get_deferred_fields())
+
+    def test_application_changelist_annotates_task_counts(self):
+        response = self.client.get(reverse('admin:tracker_application_changelist'))
+        self.assertEqual(response.status_code, 200)
+        application = response.context['cl'].result_list[0]
+        self.assertEqual((application._total_tasks, application._completed_tasks), (2, 1))
+        self.assertContains(response, '50%')
+
+    def test_decision_changelist(self):
+        Decision.objects.create(project=self.project, title='Use Postgres', description='Storage')
+        response = self.client.get(reverse('admin:tracker_decision_changelist'))
+        self.assertContains(response, '0 days')
+
+    def test_project_change_form_reads_annotated_statistics(self):
+        response = self.client.get(reverse('admin:tracker_project_change', args=[self.project.pk]))
+        self.assertEqual(response.status_code, 200)
+        project = response.context['original']
+        self.assertEqual((project._completion, project._overdue_tasks), (50.0, 1))
+
+    def test_application_inlines_save_with_deferred_columns(self):
+        task = self.application.tasks.get(title='Views')
+        Task.objects.filter(pk=task.pk).update(description='Render the timesheet')
+        url = reverse('admin:tracker_application_change', args=[self.application.pk])
+        response = self.client.get(url)
+        data = {
+            'project': self.project.pk,
+            'name': 'Timesheet',
+            'description': 'Timesheet tracker',
+            'status': 'planning',
+            'complexity': 'medium',
+            'estimated_weeks': 4,
+            'features': '[]',
+            'artifacts-TOTAL_FORMS': 0,
+            'artifacts-INITIAL_FORMS': 0,
+            'tasks-TOTAL_FORMS': 2,
+            'tasks-INITIAL_FORMS': 2,
+        }
+        for i, obj in enumerate(response.context['inline_admin_formsets'][1].formset.queryset):
+            data.update({
+                f'tasks-{i}-id': obj.pk,
+                f'tasks-{i}-application': self.application.pk,
+                f'tasks-{i}-title': obj.title,
+                f'tasks-{i}-status': 'blocked' if obj.pk == task.pk else obj.status,
+                f'tasks-{i}-priority': obj.priority,
+                f'tasks-{i}-assignee': obj.assignee,
+                f'tasks-{i}-due_date': obj.due_date or '',
+            })
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 302)
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.description), ('blocked', 'Render the timesheet'))
+
+    @mock.patch.object(LimitedInlineFormSet, 'max_rows', 1)
+    def test_project_change_form_caps_application_inline(self):
+        Application.objects.create(project=self.project, name='Chores', estimated_weeks=2)
+        response = self.client.get(reverse('admin:tracker_project_change', args=[self.project.pk]))
+        formset = response.context['inline_admin_formsets'][0].formset
+        self.assertEqual([form.instance.name for form in formset.forms], ['Chores'])
+        self.assertContains(response, 'View all 2 applications')
+
+    def test_project_change_form_queries_do_not_grow_with_applications(self):
+        url = reverse('admin:tracker_project_change', args=[self.project.pk])
+        with CaptureQueriesContext(connection) as one_application:
+            self.client.get(url)
+        for i in range(10):
+            Application.objects.create(project=self.project, name=f'App {i}', estimated_weeks=1)
+        with self.assertNumQueries(len(one_application)):
+            self.client.get(url)
+
+    def test_change_forms_render(self):
+        other = Application.objects.create(project=self.project, name='Chores', estimated_weeks=2)
+        objects = [
+            self.application,
+            Decision.objects.create(project=self.project, title='Use Postgres', description='Storage'),
+            Artifact.objects.create(application=self.application, name='Spec', type='requirements'),
+            Integration.objects.create(
+                from_app=self.application, to_app=other, integration_type='data-sharing',
+                description='Shared calendar', estimated_weeks=1,
+            ),
+        ]
+        for obj in objects:
+            opts = obj._meta
+            with self.subTest(model=opts.model_name):
+                url = reverse(f'admin:tracker_{opts.model_name}_change', args=[obj.pk])
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_integration_changelist_links_applications(self):
+        other = Application.objects.create(project=self.project, name='Chores', estimated_weeks=2)
+        Integration.objects.create(
+            from_app=self.application, to_app=other, integration_type='data-sharing',
+            description='Shared calendar', estimated_weeks=1,
+        )
+        response = self.client.get(reverse('admin:tracker_integration_changelist'), {'q': 'Chores'})
+        self.assertEqual(response.context['cl'].result_count, 1)
+        self.assertContains(response, 'Timesheet → Chores')
+        self.assertContains(response, reverse('admin:tracker_application_change', args=[other.pk]))
+
+    def test_application_filter_choices_use_one_query(self):
+        Application.objects.create(project=self.project, name='Chores', estimated_weeks=2)
+        url = reverse('admin:tracker_task_changelist')
+        with CaptureQueriesContext(connection) as two_apps:
+            response = self.client.get(url)
+        Application.objects.create(project=self.project, name='Budget', estimated_weeks=2)
+        with self.assertNumQueries(len(two_apps)):
+            response = self.client.get(url)
+        application_filter = response.context['cl'].filter_specs[0]
+        self.assertIn((self.application.pk, 'FamilyHub - Timesheet'), application_filter.lookup_choices)
+
+    def test_artifact_changelist_reads_stored_file_size(self):
+        Artifact.objects.create(application=self.application, name='Spec', type='requirements')
+        Artifact.objects.create(application=self.application, name='Wireframes', type='design')
+        Artifact.objects.filter(name='Wireframes').update(file_size_bytes=3 * 1024 * 1024)
+        response = self.client.get(reverse('admin:tracker_artifact_changelist'))
+        self.assertContains(response, '3.0 MB')
+        self.assertContains(response, 'No file')
+
+    def test_task_changelist_annotates_overdue(self):
+        response = self.client.get(reverse('admin:tracker_task_changelist'))
+        self.assertEqual(response.status_code, 200)
+        overdue = {t.title: t._overdue for t in response.context['cl'].result_list}
+        self.assertEqual(overdue, {'Views': True, 'Models': False})
+        self.assertContains(response, 'title="Task is overdue"', count=1)
+        self.assertContains(response, 'title="No due date"', count=1)
+        application = response.context['cl'].result_list[0].application
+        self.assertIn('description', application.get_deferred_fields())
+        self.assertIn('description', application.project.get_deferred_fields())
+
+    def test_decision_changelist_search(self):
+        Decision.objects.create(project=self.project, title='Use Postgres', description='Storage')
+        response = self.client.get(reverse('admin:tracker_decision_changelist'), {'q': 'Postgres'})
+        self.assertEqual(response.context['cl'].result_count, 1)
+
+    @mock.patch.object(TaskAdmin, 'list_per_page', 1)
+    def test_task_changelist_keyset_pagination(self):
+        url = reverse('admin:tracker_task_changelist')
+        first_page = self.client.get(url).context['cl']
+        self.assertEqual([t.title for t in first_page.result_list], ['Views'])
+        self.assertIsNotNone(first_page.next_cursor_url)
+
+        second_page = self.client.get(url + first_page.next_cursor_url).context['cl']
+        self.assertEqual([t.title for t in second_page.result_list], ['Models'])
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        response = self.client.get(reverse('admin:tracker_task_changelist'), {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_task_bulk_action_updates_status_and_timestamp(self):
+        before = Task.objects.get(title='Views').updated_at
+        response = self.client.post(reverse('admin:tracker_task_changelist'), {
+            'action': 'mark_as_completed',
+            '_selected_action': list(Task.objects.values_list('pk', flat=True)),
+        })
+        self.assertEqual(response.status_code, 302)
+        task = Task.objects.get(title='Views')
+        self.assertEqual(task.status, 'completed')
+        self.assertGreater(task.updated_at, before)
+
+    def test_application_autocomplete_query_count_is_constant(self):
+        url = reverse('admin:autocomplete')
+        params = {'app_label': 'tracker', 'model_name': 'task', 'field_name': 'application', 'term': ''}
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url, params)
+        Application.objects.create(project=self.project, name='Chores', estimated_weeks=2)
+        with self.assertNumQueries(len(single)):
+            response = self.client.get(url, params)
+        self.assertEqual(len(response.json()['results']), 2)
+
+
+class ApiViewTests(TrackerTestCase):
+    """JSON endpoints answer from a fixed number of queries."""
+
+    def get(self, view, *args, data=None):
+        request = RequestFactory().get('/', data)
+        request.user = self.user
+        return view(request, *args)
+
+    def post(self, view, *args, data=None):
+        request = RequestFactory().post('/', json.dumps(data), content_type='application/json')
+        request.user = self.user
+        return view(request, *args)
+
+    def test_project_progress(self):
+        Application.objects.create(project=self.project, name='Chores', estimated_weeks=2)
+        with self.assertNumQueries(2):
+            response = self.get(api_views.api_project_progress, self.project.pk)
+        project = json.loads(response.content)['project']
+        self.assertEqual((project['total_tasks'], project['completed_tasks']), (2, 1))
+        self.assertEqual(project['completion_percentage'], 50.0)
+        self.assertEqual(
+            [(app['name'], app['progress']) for app in project['applications']],
+            [('Chores', 0), ('Timesheet', 50.0)],
+        )
+
+    def test_project_health(self):
+        Project.objects.create(
+            name='Budget', description='Finances', start_date=date.today(),
+            target_date=date.today() + timedelta(days=10), owner=self.user,
+        )
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_widget_project_health)
+        health = {p['project_name']: p for p in json.loads(response.content)['project_health']}
+        self.assertEqual(health['FamilyHub']['completion_percentage'], 50.0)
+        self.assertEqual(health['Budget']['completion_percentage'], 0)
+
+    def test_kanban_data(self):
+        Task.objects.filter(title='Views').update(description='y' * 300)
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_task_kanban_data)
+        board = json.loads(response.content)
+        self.assertEqual(list(board), ['pending', 'in-progress', 'completed', 'blocked'])
+        self.assertEqual([task['title'] for task in board['pending']], ['Views'])
+        self.assertEqual(board['pending'][0]['description'], 'y' * 100)
+        self.assertEqual(board['completed'][0]['project'], 'FamilyHub')
+        self.assertEqual(board['pending'][0]['due_date'], (date.today() - timedelta(days=1)).isoformat())
+
+    @mock.patch.object(api_views, 'orjson', None)
+    def test_kanban_data_without_orjson(self):
+        board = json.loads(self.get(api_views.api_task_kanban_data).content)
+        self.assertEqual(board['pending'][0]['due_date'], (date.today() - timedelta(days=1)).isoformat())
+
+    def test_task_widgets(self):
+        Decision.objects.create(project=self.project, title='Use Postgres', description='Storage')
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_widget_recent_activity, data={'limit': 2})
+        activities = json.loads(response.content)['activities']
+        self.assertEqual(
+            [(a['type'], a['description']) for a in activities],
+            [('decision', 'in FamilyHub'), ('task', 'in Timesheet')],
+        )
+
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_widget_overdue_tasks)
+        overdue = json.loads(response.content)['overdue_tasks']
+        self.assertEqual([(t['title'], t['days_overdue']) for t in overdue], [('Views', 1)])
+
+    def test_project_statistics(self):
+        Decision.objects.create(project=self.project, title='Use Postgres', description='Storage')
+        Artifact.objects.create(application=self.application, name='Spec')
+        Artifact.objects.create(application=self.application, name='Wireframes')
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_project_statistics, self.project.pk)
+        self.assertEqual(json.loads(response.content), {
+            'applications_count': 1,
+            'total_tasks': 2,
+            'completed_tasks': 1,
+            'overdue_tasks': 1,
+            'artifacts_count': 2,
+            'decisions_count': 1,
+            'team_size': 1,
+        })
+
+    def test_application_metrics(self):
+        Application.objects.filter(pk=self.application.pk).update(features=['clock in', 'reports'])
+        Artifact.objects.create(application=self.application, name='Spec', version='1.0')
+        Artifact.objects.create(application=self.application, name='Spec', version='1.1')
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_application_metrics, self.application.pk)
+        self.assertEqual(json.loads(response.content), {
+            'tasks_total': 2,
+            'tasks_completed': 1,
+            'artifacts_count': 2,
+            'latest_version': '1.1',
+            'features_count': 2,
+        })
+        self.assertEqual(self.get(api_views.api_application_metrics, 0).status_code, 404)
+
+    def test_task_status_update_and_assign_write_with_update(self):
+        task = Task.objects.get(title='Views')
+        # The task UPDATE, the project completion UPDATE, then reading the
+        # task back and upserting its activity row
+        with self.assertNumQueries(4):
+            response = self.post(api_views.api_task_status_update, task.pk, data={'status': 'in-progress'})
+        self.assertEqual(json.loads(response.content)['status'], 'In Progress')
+        with self.assertNumQueries(4):
+            self.post(api_views.api_task_assign, task.pk, data={'assignee': 'team'})
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.assignee), ('in-progress', 'team'))
+
+        response = self.post(api_views.api_task_status_update, 0, data={'status': 'completed'})
+        self.assertEqual(response.status_code, 404)
+        response = self.post(api_views.api_task_assign, task.pk, data={'assignee': 'nobody'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_runs_one_union_query(self):
+        cache.clear()
+        Task.objects.create(
+            application=self.application, title='Timesheet export', priority='high', description='x' * 300,
+        )
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_search, data={'q': 'timesheet'})
+        results = json.loads(response.content)['results']
+        self.assertEqual(
+            sorted((r['type'], r['title']) for r in results),
+            [('application', 'Timesheet'), ('task', 'Timesheet export')],
+        )
+        task = next(r for r in results if r['type'] == 'task')
+        self.assertEqual((task['status'], task['priority']), ('pending', 'high'))
+        self.assertEqual(task['description'], 'x' * 100)
+        application = next(r for r in results if r['type'] == 'application')
+        self.assertEqual(application['project'], 'FamilyHub')
+
+        with self.assertNumQueries(1):
+            response = self.get(api_views.api_search_suggestions, data={'q': 'family'})
+        self.assertEqual(json.loads(response.content)['suggestions'], ['Project: FamilyHub'])
+
+    def test_search_reuses_recent_results_and_skips_single_characters(self):
+        cache.clear()
+        self.get(api_views.api_search, data={'q': 'Timesheet'})
+        with self.assertNumQueries(0):
+            response = self.get(api_views.api_search, data={'q': 'timesheet'})
+            self.assertEqual(len(json.loads(response.content)['results']), 1)
+            response = self.get(api_views.api_search, data={'q': 't'})
+            self.assertEqual(json.loads(response.content)['results'], [])
+
+    def test_project_status_distribution_is_cached_until_projects_change(self):
+        cache.clear()
+        self.get(api_views.api_project_status_distribution)
+        with self.assertNumQueries(0):
+            response = self.get(api_views.api_project_status_distribution)
+        self.assertEqual(json.loads(response.content)['distribution'], [{'status': 'development', 'count': 1}])
+
+        Project.objects.filter(pk=self.project.pk).get().delete()
+        response = self.get(api_views.api_project_status_distribution)
+        self.assertEqual(json.loads(response.content)['distribution'], [])
+
+    def test_malformed_bodies_are_rejected_before_querying(self):
+        request = RequestFactory().post('/', 'not json', content_type='application/json')
+        request.user = self.user
+        with self.assertNumQueries(0):
+            response = api_views.api_task_status_update(request, 1)
+            self.assertEqual(response.status_code, 400)
+            response = self.post(
+                api_views.api_task_bulk_update, data={'task_ids': [1], 'action': 'status', 'value': 'todo'}
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_task_bulk_update_reports_update_count(self):
+        task_ids = list(Task.objects.values_list('pk', flat=True))
+        with self.assertNumQueries(4):
+            response = self.post(
+                api_views.api_task_bulk_update, data={'task_ids': task_ids, 'action': 'priority', 'value': 'high'}
+            )
+        self.assertEqual(json.loads(response.content)['message'], 'Updated 2 tasks')
+        with self.assertNumQueries(0):
+            self.post(api_views.api_task_bulk_update, data={'task_ids': [], 'action': 'status', 'value': 'blocked'})
+
+    def test_bulk_update_rejects_malformed_task_ids(self):
+        for task_ids in (['abc'], 'abc', 5, [True]):
+            with self.subTest(task_ids=task_ids):
+                response = self.post(
+                    api_views.api_task_bulk_update, data={'task_ids': task_ids, 'action': 'status', 'value': 'blocked'},
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(json.loads(response.content)['success'])
+
+
+class CompletionPercentageTests(TrackerTestCase):
+    """The stored project completion follows task saves, deletes and bulk updates."""
+
+    def completion(self):
+        return Project.objects.values_list('completion_percentage', flat=True).get(pk=self.project.pk)
+
+    def test_task_signals_keep_completion_current(self):
+        self.assertEqual(self.completion(), 50.0)
+        task = Task.objects.create(application=self.application, title='Tests', status='completed')
+        self.assertEqual(self.completion(), 66.7)
+        task.delete()
+        self.assertEqual(self.completion(), 50.0)
+
+    def test_admin_bulk_action_refreshes_completion(self):
+        self.client.force_login(self.user)
+        self.client.post(reverse('admin:tracker_task_changelist') + '?status__exact=pending', {
+            'action': 'mark_as_completed',
+            '_selected_action': list(Task.objects.values_list('pk', flat=True)),
+        })
+        self.assertEqual(self.completion(), 100.0)
+
+    def other_project_application(self):
+        other = Project.objects.create(
+            name='Budget', start_date=date.today(), target_date=date.today(), owner=self.user,
+        )
+        return Application.objects.create(project=other, name='Ledger', estimated_weeks=1)
+
+    def test_moving_a_task_refreshes_the_project_it_left(self):
+        ledger = self.other_project_application()
+        task = Task.objects.get(title='Views')
+        task.application = ledger
+        task.save()
+        self.assertEqual(self.completion(), 100.0)
+        self.assertEqual(Project.objects.get(pk=ledger.project_id).completion_percentage, 0)
+
+    def test_moving_an_application_refreshes_both_projects(self):
+        ledger = self.other_project_application()
+        Task.objects.create(application=ledger, title='Import', status='completed')
+        ledger.project = self.project
+        ledger.save()
+        self.assertEqual(self.completion(), 66.7)
+        ledger.delete()
+        self.assertEqual(self.completion(), 50.0)
+
+
+class ActivityFeedTests(TrackerTestCase):
+    """The activity feed keeps one row per object, current across saves and bulk updates."""
+
+    def test_renames_update_activity_context(self):
+        Decision.objects.create(project=self.project, title='Use Postgres', description='Storage')
+        self.application.name = 'Timesheets'
+        self.application.save()
+        self.project.name = 'Family Hub'
+        self.project.save()
+        descriptions = dict(Activity.objects.values_list('target_type', 'description'))
+        self.assertEqual(descriptions, {'task': 'in Timesheets', 'decision': 'in Family Hub'})
+
+    def test_saves_and_deletes_maintain_one_row_per_object(self):
+        task = Task.objects.get(title='Views')
+        task.status = 'blocked'
+        task.save()
+        activity = Activity.objects.get(target_type='task', target_id=task.pk)
+        self.assertEqual((activity.status, activity.timestamp), ('blocked', task.updated_at))
+        self.assertEqual(Activity.objects.filter(target_type='task').count(), 2)
+
+        task.delete()
+        self.assertFalse(Activity.objects.filter(target_type='task', target_id=task.pk).exists())
+
+    def test_bulk_updates_refresh_the_feed(self):
+        tasks = Task.objects.filter(title='Views')
+        tasks.update(status='completed', updated_at=timezone.now())
+        tasks_changed(tasks)
+        self.assertEqual(Activity.objects.first().status, 'completed')
+
+
+class EstimatedCountPaginatorTests(TrackerTestCase):
+    """Large unfiltered tables use the planner estimate; everything else counts."""
+
+    @mock.patch.object(EstimatedCountPaginator, '_estimated_count', return_value=50000)
+    def test_unfiltered_queryset_uses_estimate(self, estimated_count):
+        self.assertEqual(EstimatedCountPaginator(Task.objects.all(), 10).count, 50000)
+
+    @mock.patch.object(EstimatedCountPaginator, '_estimated_count', return_value=50000)
+    def test_filtered_queryset_counts_exactly(self, estimated_count):
+        paginator = EstimatedCountPaginator(Task.objects.filter(status='pending'), 10)
+        self.assertEqual(paginator.count, 1)
+        estimated_count.assert_not_called()
+
+    @mock.patch.object(EstimatedCountPaginator, '_estimated_count', return_value=5)
+    def test_small_tables_count_exactly(self, estimated_count):
+        self.assertEqual(EstimatedCountPaginator(Task.objects.all(), 10).count, 2)
+
+
+class TaskCountPropertyTests(TrackerTestCase):
+    """Completion and overdue properties share one aggregate query per instance."""
+
+    def test_project_properties(self):
+        project = Project.objects.get(pk=self.project.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(project.completion_percentage, 50.0)
+            self.assertEqual(project.overdue_tasks_count, 1)
+
+    def test_application_properties(self):
+        application = Application.objects.get(pk=self.application.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(application.tasks_completion_percentage, 50.0)
+            self.assertEqual(application.overdue_tasks_count, 1)
+
+
+class BadgeTests(SimpleTestCase):
+    """Badges come from the prebuilt table, with an escaped fallback."""
+
+    def test_known_value_uses_prebuilt_badge(self):
+        self.assertIs(render_badge(PROJECT_STATUS_BADGES, 'on-hold'), PROJECT_STATUS_BADGES['on-hold'])
+        self.assertIn('On Hold', PROJECT_STATUS_BADGES['on-hold'])
+
+    def test_unknown_value_is_escaped(self):
+        badge = render_badge(PROJECT_STATUS_BADGES, '<archived>')
+        self.assertIn('&lt;archived&gt;', badge)
+        self.assertIn('#6c757d', badge)
+
+
+class FormHelperTests(TrackerTestCase):
+    """Forms share one class-level crispy helper that still renders per instance."""
+
+    def render(self, form):
+        return Template('{% load crispy_forms_tags %}{% crispy form %}').render(Context({'form': form}))
+
+    def test_helper_is_shared(self):
+        self.assertIs(TaskForm().helper, TaskForm().helper)
+
+    def test_renders_instance_values(self):
+        html = self.render(TaskForm(instance=Task.objects.get(title='Views')))
+        self.assertIn('value="Views"', html)
+        self.assertIn(reverse('tracker:task_list'), html)
+        self.assertIn('value="Models"', self.render(TaskForm(instance=Task.objects.get(title='Models'))))
+
+    def test_static_html_skips_template_engine(self):
+        with mock.patch('crispy_forms.layout.Template', wraps=Template) as template:
+            html = self.render(TaskForm())
+        self.assertEqual(
+            [call.args[0] for call in template.call_args_list if call.args], ['Task Information', 'Save Task'],
+        )
+        self.assertIn(f'<a href="{reverse("tracker:task_list")}" class="btn btn-secondary ms-2">Cancel</a>', html)
+
+    def test_select_options_are_cached(self):
+        cache.clear()
+        self.render(TaskForm())
+        with self.assertNumQueries(0):
+            html = self.render(TaskForm())
+        self.assertIn(f'<option value="{self.application.pk}">FamilyHub - Timesheet</option>', html)
+
+        # Application labels carry the project name, so renaming the project refreshes them
+        self.project.name = 'Hearth'
+        self.project.save()
+        self.assertIn('Hearth - Timesheet', self.render(TaskForm()))
+
+    def test_unbound_form_skips_validation(self):
+        form = TaskForm(instance=Task.objects.get(title='Views'))
+        with mock.patch.object(TaskForm, 'clean') as clean:
+            self.render(form)
+            self.assertFalse(form.is_valid())
+        clean.assert_not_called()
+
+    def test_artifact_form_keeps_multipart_and_optional_application(self):
+        form = ArtifactForm()
+        self.assertIn('enctype="multipart/form-data"', self.render(form))
+        self.assertFalse(form.fields['application'].required)
+
+
+
+class ApplicationFormTests(TrackerTestCase):
+    """Features are entered one per line and stored as a list."""
+
+    def test_features_text_is_split_into_lines(self):
+        form = ApplicationForm(data={
+            'project': self.project.pk,
+            'name': 'Budget',
+            'description': 'Budget planner',
+            'complexity': 'medium',
+            'status': 'planning',
+            'estimated_weeks': 4,
+            'features_text': ' Login \r\n\r\nReports\n  \nExport',
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().features, ['Login', 'Reports', 'Export'])
+
+    def test_features_text_initial_is_joined_on_render(self):
+        self.application.features = ['Login', 'Reports']
+        self.application.save()
+        form = ApplicationForm(instance=self.application)
+        self.assertEqual(form['features_text'].initial, 'Login\nReports')
+        self.assertIn('Login\nReports</textarea>', str(form['features_text']))
+
+
+class ArtifactFormTests(TrackerTestCase):
+    """Uploads are limited to known document and source extensions."""
+
+    def form(self, filename):
+        return ArtifactForm(
+            data={'name': 'Spec', 'content': 'Body', 'type': 'documentation', 'status': 'draft'},
+            files={'file_upload': SimpleUploadedFile(filename, b'data')},
+        )
+
+    def test_allowed_extension_is_case_insensitive(self):
+        form = self.form('notes.Final.MD')
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_increment_version(self):
+        for version, expected in [('1.9', '1.10'), ('2.0.1', '1.1'), ('', '1.1')]:
+            with self.subTest(version=version):
+                artifact = Artifact.objects.create(name='Spec', content='Body', version=version)
+                form = ArtifactForm(
+                    data={'name': 'Spec', 'content': 'Body v2', 'increment_version': True},
+                    instance=artifact,
+                )
+                self.assertTrue(form.is_valid(), form.errors)
+                self.assertEqual(form.save().version, expected)
+
+    def test_disallowed_extension(self):
+        form = self.form('setup.exe')
+        self.assertFalse(form.is_valid())
+        self.assertIn("File type 'exe' not allowed.", form.errors['file_upload'][0])
+
+
+class SearchFormTests(TrackerTestCase):
+    """Project options are cached until a project changes."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_project_choices_are_cached(self):
+        str(SearchForm()['project'])
+        with self.assertNumQueries(0):
+            html = str(SearchForm()['project'])
+        self.assertIn(f'<option value="{self.project.pk}">FamilyHub</option>', html)
+
+    def test_project_change_invalidates_choices(self):
+        str(SearchForm()['project'])
+        Project.objects.create(name='Atlas', start_date=date.today(), target_date=date.today(), owner=self.user)
+        choices = [label for _, label in SearchForm().fields['project'].choices]
+        self.assertEqual(choices, ['All Projects', 'Atlas', 'FamilyHub'])
+
+    def test_renders_without_crispy(self):
+        html = str(SearchForm(data={'query': ''}))
+        self.assertInHTML('<label class="form-label" for="id_query">Query</label>', html)
+        self.assertIn('<option value="" selected>All Projects</option>', html)
+        self.assertIn('This field is required.', html)
+        self.assertIn(f'<a href="{reverse("tracker:search")}"', html)
+
+    def test_search_page(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('tracker:search'), {'query': 'time', 'search_type': 'all'})
+        self.assertContains(response, 'name="query"')
+        self.assertContains(response, 'href="{}"'.format(self.application.get_absolute_url()))
+
+    def test_submitted_project_is_resolved(self):
+        form = SearchForm(data={'query': 'time', 'search_type': 'all', 'project': self.project.pk})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['project'], self.project)
+
+
+
+class ProjectFormTests(TrackerTestCase):
+    """Owner options are cached until a user is added, renamed or removed."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_owner_choices_are_cached(self):
+        str(ProjectForm()['owner'])
+        # Logging in only updates last_login, which keeps the cached options
+        self.client.force_login(self.user)
+        with self.assertNumQueries(0):
+            html = str(ProjectForm()['owner'])
+        self.assertIn(f'<option value="{self.user.pk}">Ada Lovelace (admin)</option>', html)
+
+    def test_new_user_invalidates_choices(self):
+        str(ProjectForm()['owner'])
+        User.objects.create_user(username='grace', first_name='Grace', last_name='Hopper')
+        choices = [label for _, label in ProjectForm().fields['owner'].choices]
+        self.assertEqual(choices, ['---------', 'Ada Lovelace (admin)', 'Grace Hopper (grace)'])
+
+
+class BulkTaskFormTests(SimpleTestCase):
+    """Selected task ids arrive as a comma-separated string."""
+
+    def clean(self, selected_tasks):
+        form = BulkTaskForm(data={'action': 'pending', 'selected_tasks': selected_tasks})
+        form.is_valid()
+        return form
+
+    def test_ids_are_parsed(self):
+        self.assertEqual(self.clean(' 3, 14,,15 ,').cleaned_data['task_ids'], [3, 14, 15])
+
+    def test_action_requires_its_field(self):
+        form = BulkTaskForm(data={'action': 'change_assignee', 'selected_tasks': '3'})
+        self.assertEqual(form.errors, {'new_assignee': ['New assignee is required for this action.']})
+        form = BulkTaskForm(data={'action': 'update_due_date', 'selected_tasks': '3', 'new_due_date': '2030-01-01'})
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_invalid_ids_are_rejected(self):
+        for selected_tasks, message in [
+            ('3,x', 'Invalid task IDs format.'),
+            ('3 4', 'Invalid task IDs format.'),
+            (', ,', 'No valid task IDs found.'),
+        ]:
+            with self.subTest(selected_tasks=selected_tasks):
+                self.assertEqual(self.clean(selected_tasks).non_field_errors(), [message])
+
+
+class BulkTaskOperationsViewTests(TrackerTestCase):
+    """The task list's bulk form posts the selection the view validates."""
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_task_list_posts_selected_tasks(self):
+        response = self.client.get(reverse('tracker:task_list'))
+        self.assertContains(response, '<input type="hidden" name="selected_tasks" id="selected-tasks">', html=True)
+
+    def test_bulk_status_update(self):
+        task = Task.objects.get(title='Views')
+        for action, status in [('in_progress', 'in-progress'), ('complete', 'completed'), ('pending', 'pending')]:
+            with self.subTest(action=action):
+                self.client.post(
+                    reverse('tracker:bulk_task_operations'), {'action': action, 'selected_tasks': str(task.pk)},
+                )
+                task.refresh_from_db()
+                self.assertEqual(task.status, status)
+
+
+class CachedTemplateLoaderCheckTests(SimpleTestCase):
+    """Production settings without the cached template loader raise a warning."""
+
+    def test_default_loaders_are_cached(self):
+        with override_settings(DEBUG=False):
+            self.assertEqual(check_cached_template_loader(None), [])
+
+    def test_uncached_loaders_warn(self):
+        templates = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {'loaders': ['django.template.loaders.app_directories.Loader']},
+        }]
+        with override_settings(DEBUG=False, TEMPLATES=templates):
+            warnings = check_cached_template_loader(None)
+        self.assertEqual([warning.id for warning in warnings], ['tracker.W001'])
+
+
+class ExportProjectDataTests(TrackerTestCase):
+    """export_project_data reads each data type in a single query."""
+
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+
+    def export(self, *args, filename='export.csv'):
+        output = os.path.join(self.output_dir.name, filename)
+        call_command('export_project_data', '--output', output, *args, stdout=io.StringIO())
+        return output
+
+    def read_csv(self, data_type):
+        with open(os.path.join(self.output_dir.name, f'export_{data_type}.csv'), newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def test_csv_export_queries_do_not_grow_with_rows(self):
+        for i in range(5):
+            Task.objects.create(application=self.application, title=f'Task {i}')
+        with self.assertNumQueries(2):
+            self.export('--format', 'csv', '--include', 'projects', 'tasks')
+        tasks = self.read_csv('tasks')
+        self.assertEqual(len(tasks), 7)
+        self.assertEqual({(task['project'], task['application']) for task in tasks}, {('FamilyHub', 'Timesheet')})
+        self.assertEqual(self.read_csv('projects')[0]['owner'], 'admin')
+
+    def test_csv_export_gzipped_for_gz_output(self):
+        self.export('--format', 'csv', '--include', 'tasks', filename='export.csv.gz')
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir.name, 'export_tasks.csv')))
+        with gzip.open(os.path.join(self.output_dir.name, 'export_tasks.csv.gz'), 'rt', newline='', encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 2)
+
+    def test_json_export_streams_valid_document(self):
+        output = self.export('--format', 'json', '--include', 'projects', 'tasks', 'decisions', filename='export.json')
+        with open(output, encoding='utf-8') as f:
+            export = json.load(f)
+        self.assertEqual(export['export_info']['include_types'], ['projects', 'tasks', 'decisions'])
+        self.assertEqual(list(export['data']), ['projects', 'tasks', 'decisions'])
+        self.assertEqual([project['owner'] for project in export['data']['projects']], ['admin'])
+        self.assertEqual(len(export['data']['tasks']), Task.objects.count())
+        self.assertEqual(export['data']['decisions'], [])
+
+    def test_json_export_covers_every_data_type(self):
+        Artifact.objects.create(name='Loose notes', content='notes')
+        with self.assertNumQueries(6):
+            output = self.export('--format', 'json', filename='export.json')
+        with open(output, encoding='utf-8') as f:
+            data = json.load(f)['data']
+        self.assertEqual(data['projects'][0]['start_date'], self.project.start_date.isoformat())
+        self.assertEqual(data['applications'][0]['project_name'], 'FamilyHub')
+        self.assertEqual(data['tasks'][0]['project_name'], 'FamilyHub')
+        self.assertIn('assignee', data['tasks'][0])
+        self.assertEqual(data['artifacts'][0]['application_name'], None)
+
+    def test_json_export_without_orjson(self):
+        with mock.patch('tracker.management.commands.export_project_data.orjson', None):
+            output = self.export('--format', 'json', '--include', 'tasks', filename='export.json')
+        with open(output, encoding='utf-8') as f:
+            tasks = json.load(f)['data']['tasks']
+        due_dates = {task['title']: task['due_date'] for task in tasks}
+        self.assertEqual(due_dates, {'Models': None, 'Views': (date.today() - timedelta(days=1)).isoformat()})
+
+    @override_settings(EXPORT_MAX_CONCURRENT=1)
+    def test_export_refused_while_another_holds_the_slot(self):
+        with export_slot():
+            with self.assertRaisesMessage(CommandError, 'Another export is already running'):
+                self.export('--format', 'csv')
+        self.export('--format', 'csv')
+        self.assertEqual(len(self.read_csv('tasks')), 2)
+
+    @override_settings(EXPORT_MAX_CONCURRENT=0)
+    def test_export_slots_require_a_positive_limit(self):
+        with self.assertRaises(ImproperlyConfigured):
+            with export_slot(wait=True):
+                pass
+
+    def test_export_slots_warn_without_file_locks(self):
+        with mock.patch('tracker.export_locks.fcntl', None), self.assertLogs('tracker.export_locks', 'WARNING'):
+            with export_slot(), export_slot():
+                pass
+
+
+class ParallelCSVExportTests(TransactionTestCase):
+    """Outside a transaction, CSV files are written from worker threads."""
+
+    def setUp(self):
+        owner = User.objects.create_user(username='owner', password='password')
+        project = Project.objects.create(
+            name='FamilyHub',
+            start_date=date.today(),
+            target_date=date.today() + timedelta(days=30),
+            owner=owner,
+        )
+        application = Application.objects.create(project=project, name='Timesheet', estimated_weeks=4)
+        for i in range(3):
+            Task.objects.create(application=application, title=f'Task {i}')
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+
+    def test_each_type_written_by_a_worker(self):
+        stdout = io.StringIO()
+        with mock.patch(
+            'tracker.management.commands.export_project_data.ThreadPoolExecutor',
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            call_command(
+                'export_project_data', '--format', 'csv',
+                '--output', os.path.join(self.output_dir.name, 'export.csv'),
+                stdout=stdout,
+            )
+        executor.assert_called_once_with(max_workers=3)
+        self.assertIn('export_tasks.csv (3 records)', stdout.getvalue())
+        with open(os.path.join(self.output_dir.name, 'export_applications.csv'), newline='', encoding='utf-8') as f:
+            self.assertEqual([row['project'] for row in csv.DictReader(f)], ['FamilyHub'])
@@ -15,7 +15,9 @@ from django.db import models
 import json
 from datetime import datetime, timedelta
 
-from .models import Project, Application, Artifact, Task, Decision, Integration, Requirement
+from .models import (
+    Project, Application, Artifact, Task, Decision, Integration, Requirement, tasks_changed,
+)
 from .forms import (
     ProjectForm, ApplicationForm, ArtifactForm, TaskForm, 
     SearchForm, BulkTaskForm, DecisionForm, IntegrationForm, RequirementForm
@@ -561,7 +563,6 @@ class TaskListView(LoginRequiredMixin, ListView):
         context['status_choices'] = Task.STATUS_CHOICES
         context['assignee_choices'] = Task.ASSIGNEE_CHOICES
         context['priority_choices'] = Task.PRIORITY_CHOICES
-        context['bulk_form'] = BulkTaskForm()
         
         # Filter values
         context.update({
@@ -619,6 +620,14 @@ class TaskUpdateView(LoginRequiredMixin, UpdateView):
         return super().form_valid(form)
 
 
+# Task status set by each bulk status action
+BULK_STATUS_ACTIONS = {
+    'complete': 'completed',
+    'in_progress': 'in-progress',
+    'pending': 'pending',
+}
+
+
 @login_required
 def bulk_task_operations_view(request):
     """Handle bulk operations on tasks."""
@@ -629,25 +638,25 @@ def bulk_task_operations_view(request):
             task_ids = form.cleaned_data['task_ids']
             
             tasks = Task.objects.filter(id__in=task_ids)
-            updated_count = 0
-            
-            if action in ['complete', 'in_progress', 'pending']:
-                tasks.update(status=action.replace('_', '-'))
-                updated_count = tasks.count()
+            now = timezone.now()
+
+            if action in BULK_STATUS_ACTIONS:
+                updated_count = tasks.update(status=BULK_STATUS_ACTIONS[action], updated_at=now)
+                tasks_changed(tasks)
                 messages.success(request, f'{updated_count} tasks updated to {action} status.')
-            
+
             elif action == 'change_assignee':
                 assignee = form.cleaned_data['new_assignee']
-                tasks.update(assignee=assignee)
-                updated_count = tasks.count()
+                updated_count = tasks.update(assignee=assignee, updated_at=now)
+                tasks_changed(tasks)
                 messages.success(request, f'{updated_count} tasks reassigned.')
-            
+
             elif action == 'update_due_date':
                 new_due_date = form.cleaned_data['new_due_date']
-                tasks.update(due_date=new_due_date)
-                updated_count = tasks.count()
+                updated_count = tasks.update(due_date=new_due_date, updated_at=now)
+                tasks_changed(tasks)
                 messages.success(request, f'{updated_count} tasks due date updated.')
-        
+
         else:
             messages.error(request, 'Error in bulk operation form.')
     